@@ -0,0 +1,42 @@
+from itertools import permutations
+
+import numpy as np
+import pytest
+from zto.problem_3.assignment import linear_assignment
+
+
+def _brute_cost(cost: np.ndarray) -> float:
+    n = len(cost)
+    return min(cost[np.arange(n), list(p)].sum() for p in permutations(range(n)))
+
+
+def _check(cost: np.ndarray) -> None:
+    perm = linear_assignment(cost)
+    n = len(cost)
+
+    assert sorted(perm.tolist()) == list(range(n))
+    assert cost[np.arange(n), perm].sum() == pytest.approx(_brute_cost(cost))
+
+
+@pytest.mark.parametrize('n', [1, 2, 3, 4, 5, 6, 7])
+def test_matches_brute_force(n):
+    rng = np.random.default_rng(n)
+    for high in [2, 5, 50]:
+        for _ in range(20):
+            _check(rng.integers(1, high, (n, n)))
+    for _ in range(20):
+        _check(rng.random((n, n)))
+        _check(rng.normal(size=(n, n)))
+
+
+@pytest.mark.parametrize('n', [1, 4, 7])
+def test_degenerate_matrices(n):
+    _check(np.zeros((n, n)))
+    _check(np.full((n, n), 3))
+    # Every assignment costs the same
+    _check(np.add.outer(np.arange(n), np.arange(n) * 10))
+
+
+def test_rejects_non_square_matrix():
+    with pytest.raises(ValueError):
+        linear_assignment(np.zeros((2, 3)))
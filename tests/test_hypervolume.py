@@ -0,0 +1,59 @@
+from itertools import combinations, product
+
+import numpy as np
+import pytest
+from zto.problem_7.hypervolume import hypervolume
+
+
+def _grid_volume(points: np.ndarray, reference: np.ndarray) -> int:
+    # Unit cells [c, c + 1) of the integer grid dominated by any point
+    volume = 0
+    for cell in product(*(range(r) for r in reference)):
+        if any((p <= cell).all() for p in points):
+            volume += 1
+
+    return volume
+
+
+def _inclusion_exclusion_volume(points: np.ndarray, reference: np.ndarray) -> int:
+    # Union of the boxes [p, reference) by inclusion-exclusion
+    points = [p for p in points if (p < reference).all()]
+    volume = 0
+    for size in range(1, len(points) + 1):
+        for subset in combinations(points, size):
+            corner = np.max(subset, axis=0)
+            volume += (-1) ** (size + 1) * np.prod(reference - corner)
+
+    return volume
+
+
+@pytest.mark.parametrize('k', [2, 3])
+@pytest.mark.parametrize('n', [1, 2, 5, 12, 30])
+def test_hypervolume_matches_grid(k, n):
+    rng = np.random.default_rng(k * 100 + n)
+    reference = np.full(k, 10)
+    for _ in range(5):
+        # Coordinates up to the reference itself, with ties and duplicates
+        points = rng.integers(0, 11, (n, k))
+        if n > 1:
+            points[-1] = points[0]
+
+        assert hypervolume(points, reference) == _grid_volume(points, reference)
+
+
+@pytest.mark.parametrize('k', [2, 3])
+def test_hypervolume_matches_inclusion_exclusion(k):
+    rng = np.random.default_rng(k)
+    for n in range(1, 9):
+        reference = rng.integers(8, 15, k)
+        points = rng.integers(0, 15, (n, k))
+
+        expected = _inclusion_exclusion_volume(points, reference)
+        assert hypervolume(points, reference) == pytest.approx(expected)
+
+
+def test_points_outside_reference_add_nothing():
+    points = np.array([[5, 5], [12, 1], [1, 10]])
+
+    assert hypervolume(points, [10, 10]) == 25.0
+    assert hypervolume(points[1:], [10, 10]) == 0.0
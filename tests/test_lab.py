@@ -0,0 +1,90 @@
+import pickle as pkl
+import random
+
+import numpy as np
+from zto.lab import Experiment, Lab
+from zto.lab.experiment import run_environment
+from zto.lab.journal import append_journal
+
+
+class CountingEnvironment:
+    runs = 0
+
+    def __init__(self, size: int, scale: int, seed: int) -> None:
+        self.size = size
+        self.scale = scale
+
+    def run(self) -> None:
+        CountingEnvironment.runs += 1
+        self.history = [
+            random.randint(0, self.scale) for _ in range(random.randint(1, self.size))
+        ]
+
+    def get_metrics(self) -> dict:
+        return {'result': min(self.history), 'history': self.history}
+
+
+def _make_lab(results_dir) -> tuple[Lab, Experiment]:
+    lab = Lab(
+        name='test',
+        env_cls=CountingEnvironment,
+        seeds=[1, 2, 3],
+        repetitions=2,
+        results_dir_path=str(results_dir),
+        size=5,
+    )
+    e = Experiment(name='scale', var_name='scale', var_values=[10, 100, 1000])
+    lab.add_experiment(e)
+
+    return lab, e
+
+
+def _load(path) -> dict:
+    with np.load(path, allow_pickle=False) as data:
+        return {key: data[key] for key in data.files}
+
+
+def test_resume_from_torn_journal_matches_clean_run(tmp_path):
+    clean_lab, _ = _make_lab(tmp_path / 'clean')
+    clean_lab.run()
+    expected = _load(tmp_path / 'clean' / 'test_scale.npz')
+
+    lab, e = _make_lab(tmp_path / 'resumed')
+    runs = list(lab._construct_runs(e))
+    done = 7
+
+    # Journal of an interrupted run: finished records and a torn last one
+    journal_path = tmp_path / 'resumed' / 'test_scale.journal'
+    with open(journal_path, 'wb') as journal:
+        for r_idx in range(done):
+            var_value, seed, args = runs[r_idx]
+            outcome = run_environment(CountingEnvironment, args)
+            append_journal(journal, r_idx, lab._get_record(e, var_value, seed, outcome))
+
+        var_value, seed, args = runs[done]
+        outcome = run_environment(CountingEnvironment, args)
+        record = lab._get_record(e, var_value, seed, outcome)
+        torn = pkl.dumps((done, record), pkl.HIGHEST_PROTOCOL)
+        journal.write(torn[: len(torn) // 2])
+
+    CountingEnvironment.runs = 0
+    lab.run(resume=True)
+
+    # Only the runs missing from the journal are executed
+    assert CountingEnvironment.runs == len(runs) - done
+    assert not journal_path.exists()
+
+    result = _load(tmp_path / 'resumed' / 'test_scale.npz')
+    assert result.keys() == expected.keys()
+    for key in expected:
+        np.testing.assert_array_equal(result[key], expected[key])
+
+
+def test_resume_skips_finished_experiment(tmp_path):
+    lab, _ = _make_lab(tmp_path)
+    lab.run()
+
+    CountingEnvironment.runs = 0
+    lab.run(resume=True)
+
+    assert CountingEnvironment.runs == 0
@@ -0,0 +1,40 @@
+import numpy as np
+import pandas as pd
+from zto.lab import Experiment, Lab, load_results
+from zto.problem_5.analysis import _process_results
+from zto.problem_5.environment import Environment
+
+SEEDS = [81178, 34091, 75746, 65927]
+
+
+def test_process_results_of_several_seeds(tmp_path):
+    lab = Lab(
+        name='p5',
+        env_cls=Environment,
+        seeds=SEEDS,
+        repetitions=2,
+        results_dir_path=str(tmp_path),
+        problem_size=12,
+        initialization_type='rnd',
+        iteration_limit=200,
+        annealing=True,
+        temperature_update='geo',
+        temperature_change=0.99,
+        problem_seed=42,
+    )
+    e = Experiment(name='geo', var_name='temperature_change', var_values=[0.9, 0.99])
+    lab.add_experiment(e)
+    lab.run()
+
+    df = pd.DataFrame(load_results(tmp_path / 'p5_geo.npz'))
+    # Every seed runs its own chain, so histories have different lengths
+    assert len({len(r) for r in df['results']}) > 1
+
+    processed = _process_results(df)
+
+    assert processed['var_val'].tolist() == [0.9, 0.99]
+    for var_val, results in zip(processed['var_val'], processed['results']):
+        histories = df.loc[df['var_val'] == var_val, 'results']
+        assert len(results) == max(len(h) for h in histories)
+        # Padding keeps the mean of the final values of all seeds
+        assert np.isclose(results[-1], np.mean([h[-1] for h in histories]))
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+from zto.problem_7.pareto import front_ranks, non_dominated
+from zto.problem_7.problem import FlowSolution
+
+CRITERIONS = ['c0', 'c1', 'c2', 'c3', 'c4']
+
+
+def _to_solutions(points: np.ndarray) -> list[FlowSolution]:
+    criterions = CRITERIONS[: points.shape[1]]
+    solutions = []
+    for point in points:
+        solution = FlowSolution([], criterions)
+        solution.state.update(zip(criterions, point))
+        solutions.append(solution)
+
+    return solutions
+
+
+def _brute_non_dominated(solutions: list[FlowSolution]) -> list[bool]:
+    return [not any(o.dominates(s) for o in solutions) for s in solutions]
+
+
+def _brute_ranks(solutions: list[FlowSolution]) -> list[int]:
+    ranks = [-1] * len(solutions)
+    remaining = list(range(len(solutions)))
+    rank = 0
+    while remaining:
+        front = [
+            i
+            for i in remaining
+            if not any(solutions[j].dominates(solutions[i]) for j in remaining)
+        ]
+        for i in front:
+            ranks[i] = rank
+        remaining = [i for i in remaining if i not in front]
+        rank += 1
+
+    return ranks
+
+
+def _random_points(rng: np.random.Generator, n: int, k: int, high: int):
+    points = rng.integers(0, high, (n, k))
+    # Duplicated points
+    if n > 1:
+        points[rng.integers(0, n, n // 4)] = points[0]
+
+    return points
+
+
+@pytest.mark.parametrize('k', [1, 2, 3, 4, 5])
+@pytest.mark.parametrize('n', [1, 2, 5, 33, 150])
+@pytest.mark.parametrize('high', [3, 50])
+def test_non_dominated_matches_brute_force(k, n, high):
+    rng = np.random.default_rng(k * 1000 + n * 10 + high)
+    for _ in range(5):
+        points = _random_points(rng, n, k, high)
+        expected = _brute_non_dominated(_to_solutions(points))
+
+        assert non_dominated(points).tolist() == expected
+
+
+@pytest.mark.parametrize('k', [1, 2, 3, 4, 5])
+@pytest.mark.parametrize('n', [1, 7, 40, 120])
+def test_front_ranks_match_brute_force(k, n):
+    rng = np.random.default_rng(k * 100 + n)
+    for high in [3, 20]:
+        points = _random_points(rng, n, k, high)
+        expected = _brute_ranks(_to_solutions(points))
+
+        assert front_ranks(points).tolist() == expected
+
+
+def test_identical_points_are_all_non_dominated():
+    points = np.ones((40, 3))
+
+    assert non_dominated(points).all()
+    assert (front_ranks(points) == 0).all()
+
+
+def test_empty_input():
+    assert len(non_dominated(np.zeros((0, 2)))) == 0
+    assert len(front_ranks(np.zeros((0, 2)))) == 0
@@ -0,0 +1,57 @@
+import random
+
+import pytest
+from zto.problem_5.QAP import QAPProblem
+
+SIZES = [2, 3, 5, 12]
+
+
+def _random_solutions(problem: QAPProblem, count: int = 10):
+    rng = random.Random(problem.size)
+    return [problem.get_random_solution(rng) for _ in range(count)]
+
+
+def _swapped_cost(problem: QAPProblem, order: list[int], i: int, j: int) -> int:
+    order = order.copy()
+    order[i], order[j] = order[j], order[i]
+
+    return problem._evaluate_order(order)
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_swap_delta_matches_full_evaluation(size):
+    problem = QAPProblem(size, 7)
+    for solution in _random_solutions(problem):
+        for i in range(size - 1):
+            for j in range(i + 1, size):
+                expected = _swapped_cost(problem, solution.order, i, j) - solution.cost
+
+                assert problem.get_swap_delta(solution, i, j) == expected
+                assert problem.get_swap_delta(solution, j, i) == expected
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_swap_deltas_match_full_evaluation(size):
+    problem = QAPProblem(size, 7)
+    for solution in _random_solutions(problem):
+        deltas = problem.get_swap_deltas(solution)
+        for i in range(size - 1):
+            for j in range(i + 1, size):
+                expected = _swapped_cost(problem, solution.order, i, j) - solution.cost
+
+                assert deltas[i, j] == expected
+
+
+@pytest.mark.parametrize('size', SIZES)
+def test_best_swap_is_the_smallest_delta(size):
+    problem = QAPProblem(size, 7)
+    for solution in _random_solutions(problem):
+        i, j, delta = problem.get_best_swap(solution)
+
+        assert i < j
+        assert delta == _swapped_cost(problem, solution.order, i, j) - solution.cost
+        assert delta == min(
+            problem.get_swap_delta(solution, a, b)
+            for a in range(size - 1)
+            for b in range(a + 1, size)
+        )
@@ -0,0 +1,52 @@
+import pytest
+from zto.RNG import RandomNumberGenerator
+
+
+@pytest.mark.parametrize('count', [0, 1, 2, 7, 64, 1000])
+@pytest.mark.parametrize('low, high', [(1, 99), (-100, 100), (0, 0)])
+def test_next_ints_match_scalar_draws(count, low, high):
+    scalar = RandomNumberGenerator(42)
+    batch = RandomNumberGenerator(42)
+
+    expected = [scalar.nextInt(low, high) for _ in range(count)]
+
+    assert batch.nextInts(low, high, count).tolist() == expected
+    # Generator state after the batch is the same as after scalar draws
+    assert [batch.nextInt(1, 1_000_000) for _ in range(5)] == [
+        scalar.nextInt(1, 1_000_000) for _ in range(5)
+    ]
+
+
+@pytest.mark.parametrize('count', [0, 1, 3, 100, 513])
+@pytest.mark.parametrize('low, high', [(5, 35), (1, 20), (1, 7)])
+def test_next_floats_match_scalar_draws(count, low, high):
+    scalar = RandomNumberGenerator(7)
+    batch = RandomNumberGenerator(7)
+
+    expected = [scalar.nextFloat(low, high) for _ in range(count)]
+
+    assert batch.nextFloats(low, high, count).tolist() == expected
+    assert batch.nextFloat(low, high) == scalar.nextFloat(low, high)
+
+
+def test_next_ints_with_float_bounds():
+    scalar = RandomNumberGenerator(42)
+    batch = RandomNumberGenerator(42)
+
+    expected = [scalar.nextInt(10.5, 200.25) for _ in range(50)]
+
+    assert batch.nextInts(10.5, 200.25, 50).tolist() == expected
+
+
+@pytest.mark.parametrize('steps', [0, 1, 2, 11, 1000, 12345])
+def test_jump_matches_scalar_draws(steps):
+    scalar = RandomNumberGenerator(50)
+    jumped = RandomNumberGenerator(50)
+
+    for _ in range(steps):
+        scalar.nextInt(1, 10)
+    jumped.jump(steps)
+
+    assert [jumped.nextInt(-100, 100) for _ in range(10)] == [
+        scalar.nextInt(-100, 100) for _ in range(10)
+    ]
@@ -0,0 +1,52 @@
+import random
+from itertools import product
+
+import pytest
+from zto.problem_3.subset_sum import SubsetSumSolver
+
+
+def _brute_distance(values: list[int], target: int) -> int:
+    return min(
+        abs(target - sum(v for v, x in zip(values, xs) if x))
+        for xs in product([0, 1], repeat=len(values))
+    )
+
+
+def _check(values: list[int], target: int) -> None:
+    x, best_sum = SubsetSumSolver(values, target).solve()
+
+    assert len(x) == len(values)
+    assert set(x) <= {0, 1}
+    assert sum(v * xi for v, xi in zip(values, x)) == best_sum
+    assert abs(target - best_sum) == _brute_distance(values, target)
+
+
+@pytest.mark.parametrize('n', [1, 2, 5, 10, 12])
+def test_matches_brute_force(n):
+    rng = random.Random(n)
+    for _ in range(30):
+        values = [rng.randint(-100, 100) for _ in range(n)]
+        target = rng.randint(-50 * n, 50 * n)
+        _check(values, target)
+
+
+def test_empty_subset_is_best():
+    x, best_sum = SubsetSumSolver([5, -7, 9], 0).solve()
+
+    assert x == [0, 0, 0]
+    assert best_sum == 0
+
+
+def test_no_values():
+    assert SubsetSumSolver([], 17).solve() == ([], 0)
+
+
+@pytest.mark.parametrize('target', [-10_000, -213, 213, 10_000])
+def test_target_out_of_range(target):
+    values = [100, -60, 30, -93, 83, 0]
+    _check(values, target)
+
+
+def test_zero_and_repeated_values():
+    _check([0, 0, 4, 4, 4, -4], 7)
+    _check([-3, -3, -3], -7)
@@ -1,25 +1,65 @@
 import math
 
+import numpy as np
+
+M = 2147483647
+A = 16807
+
 
 class RandomNumberGenerator:
     def __init__(self, seedVaule=None):
         self.__seed = seedVaule
 
-    def nextInt(self, low, high):
-        m = 2147483647
-        a = 16807
+    def _nextSeed(self):
+        m = M
+        a = A
         b = 127773
         c = 2836
         k = int(self.__seed / b)
         self.__seed = a * (self.__seed % b) - k * c
         if self.__seed < 0:
             self.__seed = self.__seed + m
-        value_0_1 = self.__seed
-        value_0_1 = value_0_1 / m
+        return self.__seed
+
+    def _nextSeeds(self, count):
+        # Seeds are consecutive powers of a (mod m) times the first one, so the
+        # sequence is filled by doubling blocks: s[i + n] = s[i] * a^n (mod m)
+        seeds = np.empty(count, dtype=np.int64)
+        if count == 0:
+            return seeds
+
+        seeds[0] = self._nextSeed()
+        filled = 1
+        while filled < count:
+            n = min(filled, count - filled)
+            seeds[filled : filled + n] = seeds[:n] * pow(A, filled, M) % M
+            filled += n
+
+        self.__seed = int(seeds[-1])
+        return seeds
+
+    def nextInt(self, low, high):
+        value_0_1 = self._nextSeed()
+        value_0_1 = value_0_1 / M
         return low + int(math.floor(value_0_1 * (high - low + 1)))
 
+    def nextInts(self, low, high, count):
+        # Same values as count consecutive nextInt calls
+        values_0_1 = self._nextSeeds(count) / M
+        return low + np.floor(values_0_1 * (high - low + 1)).astype(np.int64)
+
     def nextFloat(self, low, high):
         low *= 100000
         high *= 100000
         val = self.nextInt(low, high) / 100000.0
         return val
+
+    def nextFloats(self, low, high, count):
+        low *= 100000
+        high *= 100000
+        vals = self.nextInts(low, high, count) / 100000.0
+        return vals
+
+    def jump(self, steps):
+        # Skip steps values in O(log steps)
+        self.__seed = self.__seed * pow(A, steps, M) % M
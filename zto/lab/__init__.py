@@ -0,0 +1,3 @@
+from .cache import clear_cache, get_instance, set_cache_dir
+from .experiment import Experiment, Lab
+from .results import load_results, save_results
@@ -0,0 +1,65 @@
+import pickle as pkl
+from pathlib import Path
+from typing import Any, Callable, Optional, Union
+
+import numpy as np
+
+# Cache of generated problem instances keyed by the problem class and the
+# constructor arguments that determine the instance. Cached data is frozen:
+# arrays are made read-only and lists are turned into tuples.
+
+_instances: dict[tuple, dict[str, Any]] = {}
+_cache_dir: Optional[Path] = None
+
+
+def set_cache_dir(path: Optional[Union[str, Path]]) -> None:
+    # Optional on-disk cache shared between processes and sessions
+    global _cache_dir
+
+    _cache_dir = None if path is None else Path(path)
+    if _cache_dir is not None:
+        _cache_dir.mkdir(parents=True, exist_ok=True)
+
+
+def clear_cache() -> None:
+    _instances.clear()
+
+
+def _freeze(value: Any) -> Any:
+    if isinstance(value, np.ndarray):
+        value.flags.writeable = False
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def _get_file_path(key: tuple) -> Path:
+    name = '_'.join(str(k) for k in key)
+    return _cache_dir / f'{name}.pkl'
+
+
+def get_instance(
+    cls: type, args: tuple, generate: Callable[[], dict[str, Any]]
+) -> dict[str, Any]:
+    key = (cls.__module__, cls.__qualname__) + tuple(args)
+
+    data = _instances.get(key)
+    if data is None:
+        f_path = _get_file_path(key) if _cache_dir is not None else None
+        if f_path is not None and f_path.exists():
+            with open(f_path, 'rb') as f:
+                data = pkl.load(f)
+        else:
+            data = generate()
+            if f_path is not None:
+                with open(f_path, 'wb') as f:
+                    pkl.dump(data, f, pkl.HIGHEST_PROTOCOL)
+
+        data = {name: _freeze(value) for name, value in data.items()}
+        _instances[key] = data
+
+    return {
+        name: value.view() if isinstance(value, np.ndarray) else value
+        for name, value in data.items()
+    }
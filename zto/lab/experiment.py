@@ -0,0 +1,171 @@
+import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from timeit import default_timer
+from typing import BinaryIO, Iterator
+
+from .journal import append_journal, read_journal
+from .results import save_results
+
+
+class Experiment:
+    def __init__(self, name: str, var_name: str, var_values: list, **cont_args) -> None:
+        self.var_name = var_name
+        self.var_values = var_values
+        self.const_args = cont_args
+        self.name = name
+
+    def construct_args(self) -> Iterator[dict]:
+        for v in self.var_values:
+            self.var_value = v
+            args = self.const_args | {self.var_name: v}
+
+            yield args
+
+
+def run_environment(env_cls: type, args: dict) -> tuple[float, dict]:
+    # Each run seeds its own random state, so the outcome does not depend
+    # on the process it was executed in
+    random.seed(args['seed'])
+
+    env = env_cls(**args)
+    time_start = default_timer()
+    env.run()
+    time_end = default_timer()
+
+    # Metric extractor hook of the environment
+    return time_end - time_start, env.get_metrics()
+
+
+class Lab:
+    def __init__(
+        self,
+        name: str,
+        env_cls: type,
+        seeds: list[int],
+        repetitions: int = 10,
+        results_dir_path: str = './results',
+        time_runs: bool = False,
+        **const_args,
+    ) -> None:
+        self.env_cls = env_cls
+        self.seeds = seeds
+        self.experiments: list[Experiment] = []
+        self.repetitions = repetitions
+        self.const_args = const_args
+        # Record wall time of every environment run as a 'run_time' column
+        self.time_runs = time_runs
+
+        self.name = name
+        self.results_dir = Path(results_dir_path)
+        self.results_dir.mkdir(exist_ok=True)
+
+        self.experiment_runs = self.repetitions * len(self.seeds)
+
+    def add_experiment(self, e: Experiment) -> None:
+        self.experiments.append(e)
+
+    def _construct_runs(self, e: Experiment) -> Iterator[tuple]:
+        # Every run gets its own seed. The original loop reassigned args, so
+        # the first seed overrode all later ones and every run of a variable
+        # value solved the SEEDS[0] instance.
+        for args in e.construct_args():
+            for seed in self.seeds:
+                seed_arg = {'seed': seed}
+                for _ in range(self.repetitions):
+                    yield e.var_value, seed, self.const_args | seed_arg | args
+
+    def run(self, workers: int = 1, resume: bool = False) -> None:
+        for i, e in enumerate(self.experiments):
+            print(f'Running experiment {i + 1}/{len(self.experiments)}:')
+
+            journal_path = self._get_journal_path(e.name)
+            if resume and not journal_path.exists() and self._get_path(e.name).exists():
+                print('\rAlready done')
+                continue
+            if not resume:
+                journal_path.unlink(missing_ok=True)
+
+            runs = list(self._construct_runs(e))
+            records = read_journal(journal_path)
+            pending = [r_idx for r_idx in range(len(runs)) if r_idx not in records]
+            pending_args = [runs[r_idx][2] for r_idx in pending]
+
+            with open(journal_path, 'ab') as journal:
+                if workers > 1:
+                    # Results are yielded in submission order, so they are
+                    # merged exactly as in the serial mode
+                    with ProcessPoolExecutor(workers) as executor:
+                        chunksize = max(1, len(pending) // (4 * workers))
+                        outcomes = executor.map(
+                            run_environment,
+                            repeat(self.env_cls),
+                            pending_args,
+                            chunksize=chunksize,
+                        )
+                        self._collect_results(
+                            e, runs, pending, outcomes, records, journal
+                        )
+                else:
+                    outcomes = map(run_environment, repeat(self.env_cls), pending_args)
+                    self._collect_results(e, runs, pending, outcomes, records, journal)
+
+            print('\rDone')
+            self._compact_results(records, len(runs))
+            self._save_results(e.name)
+            journal_path.unlink()
+
+    def _collect_results(
+        self,
+        e: Experiment,
+        runs: list[tuple],
+        pending: list[int],
+        outcomes: Iterator[tuple[float, dict]],
+        records: dict[int, dict],
+        journal: BinaryIO,
+    ) -> None:
+        done = len(runs) - len(pending)
+        for exp_r, (r_idx, outcome) in enumerate(zip(pending, outcomes), start=1):
+            print(
+                f'\r({done + exp_r:-4}/{len(runs):-4})',
+                end='',
+                flush=True,
+            )
+            var_value, seed, _ = runs[r_idx]
+            record = self._get_record(e, var_value, seed, outcome)
+
+            records[r_idx] = record
+            append_journal(journal, r_idx, record)
+
+    def _get_record(
+        self,
+        e: Experiment,
+        var_value,
+        seed: int,
+        outcome: tuple[float, dict],
+    ) -> dict:
+        run_time, metrics = outcome
+
+        record = {'var_name': e.var_name, 'var_val': var_value}
+        record |= metrics
+        if self.time_runs:
+            record['run_time'] = run_time
+        record['seed'] = seed
+
+        return record
+
+    def _compact_results(self, records: dict[int, dict], runs: int) -> None:
+        self.results = {key: [] for key in records[0]} if runs else {}
+        for r_idx in range(runs):
+            for key, value in records[r_idx].items():
+                self.results[key].append(value)
+
+    def _get_path(self, name: str) -> Path:
+        return self.results_dir / f'{self.name}_{name}.npz'
+
+    def _get_journal_path(self, name: str) -> Path:
+        return self.results_dir / f'{self.name}_{name}.journal'
+
+    def _save_results(self, name: str) -> None:
+        save_results(self._get_path(name), self.results)
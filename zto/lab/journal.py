@@ -0,0 +1,28 @@
+import pickle as pkl
+from pathlib import Path
+from typing import BinaryIO
+
+
+def read_journal(f_path: Path) -> dict[int, dict]:
+    # Records of finished runs, a partially written last record is cut off
+    records = {}
+    if not f_path.exists():
+        return records
+
+    with open(f_path, 'r+b') as f:
+        valid_end = 0
+        while True:
+            try:
+                run_idx, record = pkl.load(f)
+            except (EOFError, pkl.UnpicklingError):
+                break
+            records[run_idx] = record
+            valid_end = f.tell()
+        f.truncate(valid_end)
+
+    return records
+
+
+def append_journal(f: BinaryIO, run_idx: int, record: dict) -> None:
+    pkl.dump((run_idx, record), f, pkl.HIGHEST_PROTOCOL)
+    f.flush()
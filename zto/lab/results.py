@@ -0,0 +1,53 @@
+from pathlib import Path
+from typing import Union
+
+import numpy as np
+
+# Columnar storage of Lab results in NumPy .npz files. Scalar columns are
+# stored as typed arrays, columns of per-run histories use a ragged layout:
+# concatenated values and offsets of each run.
+
+RAGGED_VALUES = '__values'
+RAGGED_OFFSETS = '__offsets'
+
+Column = Union[np.ndarray, list[np.ndarray]]
+
+
+def _is_ragged(column: list) -> bool:
+    return bool(column) and isinstance(column[0], (list, tuple, np.ndarray))
+
+
+def save_results(f_path: Union[str, Path], results: dict[str, list]) -> None:
+    arrays = {}
+    for key, column in results.items():
+        if _is_ragged(column):
+            lengths = [len(c) for c in column]
+            arrays[key + RAGGED_VALUES] = np.concatenate(
+                [np.asarray(c) for c in column]
+            )
+            arrays[key + RAGGED_OFFSETS] = np.r_[0, np.cumsum(lengths)]
+        else:
+            arrays[key] = np.asarray(column)
+
+    with open(f_path, 'wb') as f:
+        np.savez_compressed(f, **arrays)
+
+
+def load_results(f_path: Union[str, Path]) -> dict[str, Column]:
+    # Histories are returned as views into a single values array
+    results = {}
+    with np.load(f_path, allow_pickle=False) as data:
+        for key in data.files:
+            if key.endswith(RAGGED_OFFSETS):
+                continue
+            if key.endswith(RAGGED_VALUES):
+                name = key[: -len(RAGGED_VALUES)]
+                values = data[key]
+                offsets = data[name + RAGGED_OFFSETS]
+                results[name] = [
+                    values[start:end] for start, end in zip(offsets[:-1], offsets[1:])
+                ]
+            else:
+                results[key] = data[key]
+
+    return results
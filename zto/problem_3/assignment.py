@@ -0,0 +1,70 @@
+import numpy as np
+
+
+def linear_assignment(cost: np.ndarray) -> np.ndarray:
+    # Algorytm węgierski w wersji ze ścieżkami powiększającymi
+    # (Jonker-Volgenant), O(n^3). Zwraca perm, gdzie perm[i] to kolumna
+    # przydzielona do wiersza i.
+    cost = np.asarray(cost, dtype=np.float64)
+    n, cols = cost.shape
+    if n != cols:
+        raise ValueError(f'Cost matrix must be square, got {cost.shape}')
+
+    # Indeks 0 to sztuczna kolumna, od której startuje każda ścieżka
+    u = np.zeros(n + 1)
+    v = np.zeros(n + 1)
+    row_of = np.zeros(n + 1, dtype=np.int64)
+    way = np.zeros(n + 1, dtype=np.int64)
+
+    # Redukcja kolumn i wierszy z zachłannym przydziałem krawędzi zerowych,
+    # zostają tylko wiersze wymagające ścieżek powiększających
+    v[1:] = cost.min(axis=0)
+    matched = np.zeros(n + 1, dtype=bool)
+    for j, i in enumerate(cost.argmin(axis=0), 1):
+        if not matched[i + 1]:
+            matched[i + 1] = True
+            row_of[j] = i + 1
+
+    reduced = cost - v[1:]
+    u[1:] = reduced.min(axis=1)
+    for i in np.flatnonzero(~matched[1:]) + 1:
+        tight = np.flatnonzero((reduced[i - 1] == u[i]) & (row_of[1:] == 0))
+        if len(tight):
+            matched[i] = True
+            row_of[tight[0] + 1] = i
+
+    for i in np.flatnonzero(~matched[1:]) + 1:
+        row_of[0] = i
+        j0 = 0
+        min_v = np.full(n + 1, np.inf)
+        used = np.zeros(n + 1, dtype=bool)
+
+        while row_of[j0] != 0:
+            used[j0] = True
+            i0 = row_of[j0]
+
+            free = ~used
+            reduced = cost[i0 - 1] - u[i0] - v[1:]
+            better = free[1:] & (reduced < min_v[1:])
+            min_v[1:][better] = reduced[better]
+            way[1:][better] = j0
+
+            masked = np.where(free, min_v, np.inf)
+            j1 = int(np.argmin(masked))
+            delta = masked[j1]
+
+            u[row_of[used]] += delta
+            v[used] -= delta
+            min_v[free] -= delta
+            j0 = j1
+
+        # Odwrócenie ścieżki powiększającej
+        while j0:
+            j1 = way[j0]
+            row_of[j0] = row_of[j1]
+            j0 = j1
+
+    perm = np.empty(n, dtype=np.int64)
+    perm[row_of[1:] - 1] = np.arange(n)
+
+    return perm
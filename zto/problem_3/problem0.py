@@ -1,13 +1,16 @@
 # %%
 from docplex.mp.model import Model
 
+from .timing import ModelTimer
+
 # %%
 n = 6
 k = 4
 # %%
-m = Model(name='test')
-# %%
-x = [[m.binary_var(name=f'x{i}{j}') for j in range(k)] for i in range(n)]
+timer = ModelTimer()
+with timer.build():
+    m = Model(name='test')
+    x = [[m.binary_var(name=f'x{i}{j}') for j in range(k)] for i in range(n)]
 # %%
 values = [
     [7, 2, 9, 3],
@@ -18,11 +21,12 @@ values = [
     [3, 2, 2, 2],
 ]
 # %%
-m.maximize(m.sum(x[i][j] * values[i][j] for i in range(n) for j in range(k)))
-# %%
-for i in range(n):
-    m.add_constraint(m.sum(x[i][j] for j in range(k)) <= 1)
+with timer.build():
+    m.maximize(m.sum(x[i][j] * values[i][j] for i in range(n) for j in range(k)))
+    for i in range(n):
+        m.add_constraint(m.sum(x[i][j] for j in range(k)) <= 1)
 # %%
-s = m.solve(log_output=True)
+s, stats = timer.solve(m, log_output=True)
+print(stats)
 # %%
 s.display()
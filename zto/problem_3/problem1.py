@@ -1,10 +1,11 @@
-import io
 import math
 
 import matplotlib.pyplot as plt
 import pandas as pd
 from docplex.mp.model import Model
 
+from .timing import ModelTimer
+
 
 class RandomNumberGenerator:
     def __init__(self, seedVaule=None):
@@ -47,17 +48,20 @@ print(df)
 
 T = R.nextInt(-50 * n, 50 * n)
 
-m = Model(name='Problem sumy podzbioru')
+timer = ModelTimer()
+with timer.build():
+    m = Model(name='Problem sumy podzbioru')
 
-x = []
-for i in range(0, n):
-    x.append(m.binary_var(name=f'x{i+1}'))
+    x = []
+    for i in range(0, n):
+        x.append(m.binary_var(name=f'x{i+1}'))
 
-m.minimize(m.abs(T - m.sum(x[i] * values[i] for i in range(0, n))))
+    m.minimize(m.abs(T - m.sum(x[i] * values[i] for i in range(0, n))))
 
-m.solve()
+s, stats = timer.solve(m)
 print('T: ', T)
-m.solve().display()
+s.display()
+print(stats)
 
 
 def Solver(n):
@@ -67,20 +71,19 @@ def Solver(n):
 
     T = R.nextInt(-50 * n, 50 * n)
 
-    m = Model(name='Problem sumy podzbioru')
+    timer = ModelTimer()
+    with timer.build():
+        m = Model(name='Problem sumy podzbioru')
 
-    x = []
-    for i in range(0, n):
-        x.append(m.binary_var(name=f'x{i + 1}'))
-
-    m.minimize(m.abs(T - m.sum(x[i] * values[i] for i in range(0, n))))
+        x = []
+        for i in range(0, n):
+            x.append(m.binary_var(name=f'x{i + 1}'))
 
-    out_stream = io.StringIO()
-    s = m.solve(log_output=out_stream)
+        m.minimize(m.abs(T - m.sum(x[i] * values[i] for i in range(0, n))))
 
-    ex_time = float(out_stream.getvalue().splitlines()[-1].split()[-4])
+    _, stats = timer.solve(m)
 
-    return ex_time
+    return stats.solver_time
 
 
 numbers = [10, 50, 150, 350, 750, 996]  # 996 - max
@@ -1,10 +1,10 @@
 # %%
-import io
-
+import numpy as np
 from docplex.mp.model import Model
 from matplotlib import pyplot as plt
 
 from ..RNG import RandomNumberGenerator as RNG
+from .timing import ModelTimer
 
 
 # %%
@@ -14,50 +14,60 @@ class Problem2:
 
         gen = RNG(seed)
 
-        self.a = [gen.nextFloat(5, 35) for _ in range(n)]
-        self.b = [gen.nextFloat(5, 35) for _ in range(n)]
-        self.r = [gen.nextFloat(1, 7) for _ in range(n)]
+        self.a = gen.nextFloats(5, 35, n).tolist()
+        self.b = gen.nextFloats(5, 35, n).tolist()
+        self.r = gen.nextFloats(1, 7, n).tolist()
 
-        self.f = [
-            [0 if i == j else gen.nextFloat(1, 20) for j in range(n)] for i in range(n)
-        ]
+        # Przepływy poza przekątną generowane wierszami
+        f = np.zeros((n, n))
+        f[~np.eye(n, dtype=bool)] = gen.nextFloats(1, 20, n * (n - 1))
+        self.f = f.tolist()
 
         self.m = Model(name='Kwadratowe zagadnienie przydzialu')
+        self.timer = ModelTimer()
 
     def setup(self) -> None:
-        self.x = [
-            [self.m.continuous_var(name=f'x{i}'), self.m.continuous_var(name=f'y{i}')]
-            for i in range(self.n)
-        ]
-
-        self.m.minimize(
-            self.m.sum(
-                self.f[i][j]
-                * (
-                    self.m.abs(self.x[i][0] - self.x[j][0])
-                    + self.m.abs(self.x[i][1] - self.x[j][1])
-                )
-                for i in range(self.n)
-                for j in range(self.n)
-            )
+        with self.timer.build():
+            self._build()
+
+    def _build(self) -> None:
+        n = self.n
+        m = self.m
+
+        xs = m.continuous_var_list(n, name=lambda i: f'x{i}')
+        ys = m.continuous_var_list(n, name=lambda i: f'y{i}')
+        self.x = list(zip(xs, ys))
+
+        # Symetryczny przepływ tylko dla par i < j, pary bez przepływu pomijane
+        f = np.asarray(self.f)
+        w = np.triu(f + f.T, k=1)
+        pairs = list(zip(*np.nonzero(w)))
+        weights = [float(w[i, j]) for i, j in pairs]
+
+        # |x_i - x_j| zastąpione zmienną d >= x_i - x_j, d >= x_j - x_i
+        dx = m.continuous_var_list(len(pairs), name='dx')
+        dy = m.continuous_var_list(len(pairs), name='dy')
+        for d, v in ((dx, xs), (dy, ys)):
+            m.add_constraints(d[k] >= v[i] - v[j] for k, (i, j) in enumerate(pairs))
+            m.add_constraints(d[k] >= v[j] - v[i] for k, (i, j) in enumerate(pairs))
+
+        m.minimize(m.scal_prod(dx, weights) + m.scal_prod(dy, weights))
+
+        # Kula w metryce L1 jako cztery ograniczenia liniowe
+        m.add_constraints(
+            sx * (xs[i] - self.a[i]) + sy * (ys[i] - self.b[i]) <= self.r[i]
+            for i in range(n)
+            for sx in (-1, 1)
+            for sy in (-1, 1)
         )
 
-        for i in range(self.n):
-            self.m.add_constraint(
-                (
-                    self.m.abs(self.x[i][0] - self.a[i])
-                    + self.m.abs(self.x[i][1] - self.b[i])
-                    <= self.r[i]
-                )
-            )
-
     def solve(self) -> None:
-        out_stream = io.StringIO()
-        self.solution = self.m.solve(log_output=out_stream)
+        self.solution, self.stats = self.timer.solve(self.m)
 
-        self.ex_time = float(out_stream.getvalue().splitlines()[-1].split()[-4])
-        self.values = (
-            self.solution.as_df().head(20).set_index('name').to_dict()['value']
+        self.ex_time = self.stats.solver_time
+        variables = [v for x in self.x for v in x]
+        self.values = dict(
+            zip([v.name for v in variables], self.solution.get_values(variables))
         )
 
     def visualize(self) -> None:
@@ -96,3 +106,8 @@ p.setup()
 p.solve()
 p.visualize()
 # %%
+for n in [10, 20, 40, 80, 160]:
+    p = Problem2(n)
+    p.setup()
+    p.solve()
+    print(f'n={n} build={p.stats.build_time:.3f}s solve={p.stats.solve_time:.3f}s')
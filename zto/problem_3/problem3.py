@@ -1,33 +1,81 @@
 # %%
+import time
+
 import numpy as np
 from docplex.mp.model import Model
 from matplotlib import pyplot as plt
 
 from ..RNG import RandomNumberGenerator as RNG
+from .assignment import linear_assignment
+from .timing import ModelTimer
+
 
 # %%
-n = 25
-m = Model(name='Zagadnienie przydziału')
+def generate(n: int, seed: int = 42) -> np.ndarray:
+    gen = RNG(seed)
+    return gen.nextInts(1, 50, n * n).reshape(n, n)
+
+
+def solve_mip(k: np.ndarray, log_output: bool = False):
+    n = len(k)
+    k = k.tolist()
+
+    timer = ModelTimer()
+    with timer.build():
+        m = Model(name='Zagadnienie przydziału')
+        x = [[m.binary_var(name=f'x_{i}_{j}') for j in range(n)] for i in range(n)]
+
+        m.minimize(m.sum(x[i][j] * k[i][j] for j in range(n) for i in range(n)))
+        for i in range(n):
+            m.add_constraint(m.sum(x[i]) == 1)
+            m.add_constraint(m.sum(x[j][i] for j in range(n)) == 1)
+
+    s, stats = timer.solve(m, log_output=log_output)
+    perm = np.array(
+        [max(range(n), key=lambda j: s.get_value(x[i][j])) for i in range(n)]
+    )
+
+    return perm, stats
 
-gen = RNG(42)
-k = [[gen.nextInt(1, 50) for _ in range(n)] for _ in range(n)]
-x = [[m.binary_var(name=f'x_{i}_{j}') for j in range(n)] for i in range(n)]
 
-m.minimize(m.sum(x[i][j] * k[i][j] for j in range(n) for i in range(n)))
-for i in range(n):
-    m.add_constraint(m.sum(x[i]) == 1)
-    m.add_constraint(m.sum(x[j][i] for j in range(n)) == 1)
+# %%
+n = 25
+k = generate(n)
+
+perm, stats = solve_mip(k, log_output=True)
+print(stats)
 
-s = m.solve(log_output=True)
-vals = s.as_df().set_index('name').to_dict()['value']
+h_perm = linear_assignment(k)
+print('MIP:', k[np.arange(n), perm].sum(), 'Hungarian:', k[np.arange(n), h_perm].sum())
 
 mat = np.zeros((n, n))
-for n, v in vals.items():
-    _, x, y = n.split('_')
-    mat[int(x)][int(y)] = 1
+mat[np.arange(n), perm] = 1
 # %%
-s.display()
 plt.axis('off')
 plt.imshow(mat)
 
 # %%
+mip_sizes = [25, 50, 100, 200]
+sizes = [25, 50, 100, 200, 500, 1000]
+
+mip_times = []
+for size in mip_sizes:
+    _, stats = solve_mip(generate(size))
+    mip_times.append(stats.build_time + stats.solve_time)
+
+hungarian_times = []
+for size in sizes:
+    k = generate(size)
+    start = time.perf_counter()
+    linear_assignment(k)
+    hungarian_times.append(time.perf_counter() - start)
+
+plt.plot(mip_sizes, mip_times, marker='o', label='MIP')
+plt.plot(sizes, hungarian_times, marker='o', label='Hungarian')
+
+plt.xlabel('n')
+plt.ylabel('Time [s]')
+plt.legend()
+plt.show()
+
+# %%
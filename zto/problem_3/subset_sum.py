@@ -0,0 +1,87 @@
+import time
+
+import matplotlib.pyplot as plt
+
+from ..RNG import RandomNumberGenerator as RNG
+
+
+class SubsetSumSolver:
+    # Dokładny DP dla sumy podzbioru: osiągalne sumy trzymane jako bity liczby
+    # całkowitej, bit s - low oznacza sumę s (low - suma wartości ujemnych)
+    def __init__(self, values: list[int], target: int) -> None:
+        self.values = values
+        self.target = target
+
+        self.low = sum(v for v in values if v < 0)
+        self.high = sum(v for v in values if v > 0)
+
+    def _reachable(self) -> list[int]:
+        # layers[i] - sumy osiągalne z pierwszych i wartości
+        layers = [1 << -self.low]
+        for v in self.values:
+            reach = layers[-1]
+            reach |= reach << v if v >= 0 else reach >> -v
+            layers.append(reach)
+
+        return layers
+
+    def _closest(self, reach: int) -> int:
+        t = min(max(self.target - self.low, 0), self.high - self.low)
+
+        below = reach & ((1 << (t + 1)) - 1)
+        above = reach >> t
+
+        candidates = []
+        if below:
+            candidates.append(below.bit_length() - 1)
+        if above:
+            candidates.append(t + (above & -above).bit_length() - 1)
+
+        best = min(candidates, key=lambda pos: abs(self.target - self.low - pos))
+        return best + self.low
+
+    def solve(self) -> tuple[list[int], int]:
+        layers = self._reachable()
+        best_sum = self._closest(layers[-1])
+
+        # Odtwarzanie rozwiązania od ostatniej wartości
+        x = [0] * len(self.values)
+        s = best_sum
+        for i in range(len(self.values) - 1, -1, -1):
+            if not layers[i] >> (s - self.low) & 1:
+                x[i] = 1
+                s -= self.values[i]
+
+        return x, best_sum
+
+
+def Solver(n: int, R: RNG) -> float:
+    # Te same instancje co Solver z problem1
+    values = R.nextInts(-100, 100, n).tolist()
+    T = R.nextInt(-50 * n, 50 * n)
+
+    start = time.perf_counter()
+    SubsetSumSolver(values, T).solve()
+    ex_time = time.perf_counter() - start
+
+    return ex_time
+
+
+def timing_sweep(numbers: list[int], seed: int = 50, skip: int = 11) -> list[float]:
+    R = RNG(seed)
+    # problem1 zużywa najpierw 11 liczb na przykład dla n = 10
+    R.jump(skip)
+
+    return [Solver(n, R) for n in numbers]
+
+
+if __name__ == '__main__':
+    numbers = [10, 50, 150, 350, 750, 996]  # 996 - max
+    timelist = timing_sweep(numbers)
+
+    plt.scatter(numbers, timelist)
+    plt.plot(numbers, timelist)
+
+    plt.xlabel('Number of values')
+    plt.ylabel('Time [s]')
+    plt.show()
@@ -0,0 +1,50 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+from docplex.mp.model import Model
+from docplex.mp.solution import SolveSolution
+
+
+@dataclass
+class SolveStats:
+    build_time: float
+    solve_time: float
+    solver_time: float
+    nodes: int
+    gap: float
+    status: str
+
+
+class ModelTimer:
+    # Czasy budowy i rozwiązania modelu bez przechwytywania logu CPLEX
+    def __init__(self) -> None:
+        self.build_time = 0.0
+
+    @contextmanager
+    def build(self) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.build_time += time.perf_counter() - start
+
+    def solve(
+        self, model: Model, **kwargs
+    ) -> tuple[Optional[SolveSolution], SolveStats]:
+        start = time.perf_counter()
+        solution = model.solve(**kwargs)
+        solve_time = time.perf_counter() - start
+
+        details = model.solve_details
+        stats = SolveStats(
+            build_time=self.build_time,
+            solve_time=solve_time,
+            solver_time=details.time,
+            nodes=details.nb_nodes_processed,
+            gap=details.mip_relative_gap,
+            status=details.status,
+        )
+
+        return solution, stats
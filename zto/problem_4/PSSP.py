@@ -1,63 +1,200 @@
+from array import array
 from random import seed, shuffle
-from typing import Optional
+from typing import Iterator, Literal, Optional
 
+from ..lab.cache import get_instance
 from ..RNG import RandomNumberGenerator
 from .solvers import Problem, Solution
 
+BOUND = Literal['machine', 'johnson']
+
+
+def _iter_tasks(tasks_mask: int) -> Iterator[int]:
+    # Tasks encoded in the bitmask in ascending order
+    while tasks_mask:
+        low_bit = tasks_mask & -tasks_mask
+        yield low_bit.bit_length() - 1
+        tasks_mask ^= low_bit
+
 
 class PSSPProblem(Problem):
-    def __init__(self, tasks: int, machines: int, rng_seed: int = 42) -> None:
+    def __init__(
+        self, tasks: int, machines: int, rng_seed: int = 42, bound: BOUND = 'machine'
+    ) -> None:
         self.tasks = tasks
         self.machines = machines
+        self.bound = bound
 
         seed(rng_seed)
-        rng = RandomNumberGenerator(rng_seed)
-        self.cost = [
-            [rng.nextInt(1, 99) for _ in range(machines)] for _ in range(tasks)
+        instance = get_instance(
+            type(self),
+            (tasks, machines, rng_seed),
+            lambda: self._generate(tasks, machines, rng_seed),
+        )
+        self.cost = instance['cost']
+
+        # Work left on each machine after the task leaves it
+        self.tails = [
+            [sum(c[machine + 1 :]) for machine in range(machines)] for c in self.cost
         ]
+        # Task order for consecutive machine pairs given by Johnson's rule
+        self.johnson_orders = [
+            self._johnson_order(machine) for machine in range(machines - 1)
+        ]
+
+    @staticmethod
+    def _generate(tasks: int, machines: int, rng_seed: int) -> dict:
+        rng = RandomNumberGenerator(rng_seed)
+        cost = rng.nextInts(1, 99, tasks * machines).reshape(tasks, machines).tolist()
+
+        return {'cost': cost}
+
+    def _johnson_order(self, machine: int) -> list[int]:
+        first, second = [], []
+        for t in range(self.tasks):
+            if self.cost[t][machine] < self.cost[t][machine + 1]:
+                first.append(t)
+            else:
+                second.append(t)
+
+        first.sort(key=lambda t: self.cost[t][machine])
+        second.sort(key=lambda t: self.cost[t][machine + 1], reverse=True)
+
+        return first + second
+
+    def _get_root(self) -> 'PSSPSolution':
+        tasks_left = (1 << self.tasks) - 1
+        time = array('l', [0 for _ in range(self.machines)])
+
+        return PSSPSolution(None, -1, tasks_left, 0, time)
+
+    def _get_time(self, solution: 'PSSPSolution') -> array:
+        # Completion times are kept only on expanded nodes, a node taken from
+        # the frontier derives them from its parent when it is expanded
+        if solution.work_time is None:
+            parent_time = self._get_time(solution.parent)
+            solution.work_time = array('l', self._next_time(parent_time, solution.task))
+
+        return solution.work_time
+
+    def _next_time(self, time: array, task: int) -> list[int]:
+        new_time = []
+        prev_machine_time = 0
+        for t, c in zip(time, self.cost[task]):
+            prev_machine_time = (t if t > prev_machine_time else prev_machine_time) + c
+            new_time.append(prev_machine_time)
+
+        return new_time
+
+    def _get_work_left(self, tasks_left: int) -> list[int]:
+        work_left = [0] * self.machines
+        for t in _iter_tasks(tasks_left):
+            for machine, c in enumerate(self.cost[t]):
+                work_left[machine] += c
+
+        return work_left
+
+    def _get_min_tails(self, tasks_left: int) -> list[tuple]:
+        # Two smallest tails on each machine, so the minimum after removing
+        # any single task is available in O(1)
+        tasks = list(_iter_tasks(tasks_left))
+        min_tails = []
+        for machine in range(self.machines):
+            tails = sorted((self.tails[t][machine], t) for t in tasks)[:2]
+            tails += (2 - len(tails)) * [(0, None)]
+            min_tails.append(tails)
+
+        return min_tails
+
+    def _estimate_cost(
+        self,
+        tasks_left: int,
+        time: list[int],
+        work_left: list[int],
+        min_tails: list[tuple],
+        task: int,
+    ) -> int:
+        # Lower bound on the makespan - every machine still has to process its
+        # remaining work and the last task on it has to pass through the rest.
+        # work_left is the work before task was scheduled.
+        lower_bound = time[-1]
+        if tasks_left:
+            cost = self.cost[task]
+            for machine in range(self.machines):
+                (tail_0, task_0), (tail_1, _) = min_tails[machine]
+                min_tail = tail_1 if task_0 == task else tail_0
+                machine_bound = (
+                    time[machine] + work_left[machine] - cost[machine] + min_tail
+                )
+                if machine_bound > lower_bound:
+                    lower_bound = machine_bound
+
+            if self.bound == 'johnson':
+                lower_bound = max(lower_bound, self._johnson_bound(tasks_left, time))
+
+        return lower_bound - time[-1]
+
+    def _johnson_bound(self, tasks_left: int, time: list[int]) -> int:
+        # Two machine relaxation solved optimally with Johnson's rule
+        lower_bound = 0
+        for machine, order in enumerate(self.johnson_orders):
+            time_a, time_b = time[machine], time[machine + 1]
+            min_tail = min(self.tails[t][machine + 1] for t in _iter_tasks(tasks_left))
+            for t in order:
+                if tasks_left >> t & 1:
+                    time_a += self.cost[t][machine]
+                    time_b = max(time_b, time_a) + self.cost[t][machine + 1]
+            lower_bound = max(lower_bound, time_b + min_tail)
+
+        return lower_bound
+
+    def _append_task(
+        self,
+        solution: 'PSSPSolution',
+        task: int,
+        work_left: list[int],
+        min_tails: list[tuple],
+    ) -> 'PSSPSolution':
+        # The child keeps only its bound, its times are not stored until it
+        # is expanded itself
+        new_tasks_left = solution.tasks_left & ~(1 << task)
+        new_time = self._next_time(self._get_time(solution), task)
+        estimated_cost = self._estimate_cost(
+            new_tasks_left, new_time, work_left, min_tails, task
+        )
+
+        return PSSPSolution(
+            solution, task, new_tasks_left, new_time[-1] + estimated_cost
+        )
 
     def expand(self, solution: Optional['PSSPSolution'] = None) -> list['PSSPSolution']:
         if solution is None:
-            tasks_left = [i for i in range(self.tasks)]
-            sequence = []
-            time = [0 for _ in range(self.machines)]
-        else:
-            tasks_left = solution.tasks_left
-            sequence = solution.tasks_sequence
-            time = solution.work_time
+            solution = self._get_root()
+
+        work_left = self._get_work_left(solution.tasks_left)
+        min_tails = self._get_min_tails(solution.tasks_left)
 
         new_solutions = []
-        for task in tasks_left:
-            new_tasks_left = tasks_left.copy()
-            new_tasks_left.remove(task)
-
-            new_sequence = sequence.copy()
-            new_sequence.append(task)
-
-            new_time = time.copy()
-            prev_machine_time = 0
-            for machine, t in enumerate(new_time):
-                new_time[machine] = max(prev_machine_time, t) + self.cost[task][machine]
-                prev_machine_time = new_time[machine]
-            estimated_cost = sum([self.cost[t][-1] for t in new_tasks_left])
-
-            new_solution = PSSPSolution(
-                new_sequence, new_tasks_left, new_time, estimated_cost
-            )
+        for task in _iter_tasks(solution.tasks_left):
+            new_solution = self._append_task(solution, task, work_left, min_tails)
             new_solutions.append(new_solution)
 
         return new_solutions
 
+    def _get_sequence_solution(self, sequence: list[int]) -> 'PSSPSolution':
+        solution = self._get_root()
+        for task in sequence:
+            work_left = self._get_work_left(solution.tasks_left)
+            min_tails = self._get_min_tails(solution.tasks_left)
+            solution = self._append_task(solution, task, work_left, min_tails)
+
+        return solution
+
     def get_rand_solution(self) -> Solution:
         sequence = list(range(self.tasks))
         shuffle(sequence)
 
-        solution = PSSPSolution([], [], [0 for _ in range(self.machines)], 0)
-        for task in sequence:
-            solution.tasks_left.append(task)
-            solution = self.expand(solution)[0]
-
-        return solution
+        return self._get_sequence_solution(sequence)
 
     def get_greedy_solution(self) -> Solution:
         solutions = self.expand()
@@ -74,28 +211,45 @@ class PSSPProblem(Problem):
     def get_dfs_solution(self) -> Solution:
         sequence = list(range(self.tasks))
 
-        solution = PSSPSolution([], [], [0 for _ in range(self.machines)], 0)
-        for task in sequence:
-            solution.tasks_left.append(task)
-            solution = self.expand(solution)[0]
-
-        return solution
+        return self._get_sequence_solution(sequence)
 
 
 class PSSPSolution(Solution):
+    # Search node, the task sequence is kept as a chain of parent pointers
+    # and rebuilt only on demand. Machine completion times are filled in
+    # only when the node is expanded.
+    __slots__ = ('parent', 'task', 'tasks_left', 'work_time')
+
     def __init__(
         self,
-        task_sequence: list[int],
-        tasks_left: list[int],
-        work_time: list[int],
-        estimated_cost: int,
+        parent: Optional['PSSPSolution'],
+        task: int,
+        tasks_left: int,
+        value: int,
+        work_time: Optional[array] = None,
     ) -> None:
-        super().__init__(work_time[-1] + estimated_cost, is_final=not tasks_left)
-
-        self.tasks_sequence = task_sequence
+        super().__init__(
+            value,
+            is_final=not tasks_left,
+            depth=0 if parent is None else parent.depth + 1,
+        )
+
+        self.parent = parent
+        self.task = task
         self.tasks_left = tasks_left
         self.work_time = work_time
 
+    @property
+    def tasks_sequence(self) -> list[int]:
+        sequence = []
+        solution = self
+        while solution.parent is not None:
+            sequence.append(solution.task)
+            solution = solution.parent
+        sequence.reverse()
+
+        return sequence
+
     def visualize(self) -> None:
         print(f'Task sequence: {self.tasks_sequence}')
-        print(f'Final time: {self.work_time[-1]}')
+        print(f'Final time: {self.value}')
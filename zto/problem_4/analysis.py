@@ -1,16 +1,14 @@
-import pickle as pkl
-
 import matplotlib.pyplot as plt
 import pandas as pd
 from tabulate import tabulate
 
+from ..lab import Experiment, Lab, load_results
 from .environment import P4Environment
-from .experiment import Experiment, Lab
 
 SEEDS = [81178, 34091, 75746, 65927, 1173, 70912, 19419, 50363, 82748, 4511]
 
 
-def run_lab():
+def run_lab(workers: int = 1, resume: bool = False):
     lab = Lab(
         name='p4',
         env_cls=P4Environment,
@@ -58,23 +56,22 @@ def run_lab():
     )
     lab.add_experiment(e5)
 
-    lab.run()
+    lab.run(workers, resume)
 
 
 def report() -> None:
     files = [
-        './results/p4_bb_enq_lim.pkl',
-        './results/p4_bb_enq_lim_init.pkl',
-        './results/p4_bb_init_type.pkl',
-        './results/p4_bf.pkl',
-        './results/p4_bb_tasks_num.pkl',
+        './results/p4_bb_enq_lim.npz',
+        './results/p4_bb_enq_lim_init.npz',
+        './results/p4_bb_init_type.npz',
+        './results/p4_bf.npz',
+        './results/p4_bb_tasks_num.npz',
     ]
 
     data = []
     for name in files:
-        with open(name, 'rb') as f:
-            d = pkl.load(f)
-            data.append(d)
+        d = load_results(name)
+        data.append(d)
     dfs = [pd.DataFrame(d) for d in data]
 
     dfs[2]['var_val'] = dfs[2]['var_val'].replace(
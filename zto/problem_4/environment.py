@@ -1,8 +1,8 @@
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Literal
 
-from .PSSP import PSSPProblem
-from .solvers import INIT, BranchAndBound, BruteForce
+from .PSSP import BOUND, PSSPProblem
+from .solvers import INIT, QUEUE, BranchAndBound, BruteForce
 
 if TYPE_CHECKING:
     from .solvers import Problem, Solver
@@ -20,6 +20,10 @@ class Environment(ABC):
     def run(self) -> None:
         pass
 
+    @abstractmethod
+    def get_metrics(self) -> dict:
+        pass
+
 
 class P4Environment(Environment):
     def __init__(
@@ -30,15 +34,25 @@ class P4Environment(Environment):
         tasks: int,
         machines: int,
         seed: int,
+        queue_type: QUEUE = 'best',
+        bound: BOUND = 'machine',
     ) -> None:
         optimization_type = 'min'
 
         if method == 'bb':
-            self.solver = BranchAndBound(optimization_type, init_type, enqueue_limit)
+            self.solver = BranchAndBound(
+                optimization_type, init_type, enqueue_limit, queue_type
+            )
         elif method == 'bf':
             self.solver = BruteForce(optimization_type)
 
-        self.problem = PSSPProblem(tasks, machines, seed)
+        self.problem = PSSPProblem(tasks, machines, seed, bound)
 
     def run(self) -> None:
         self.solver.solve(self.problem)
+
+    def get_metrics(self) -> dict:
+        return {
+            'time': self.solver.solution_time,
+            'result': self.solver.best_solution.value,
+        }
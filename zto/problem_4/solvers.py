@@ -1,25 +1,23 @@
+import heapq
 from abc import ABC, abstractmethod
-from dataclasses import dataclass, field
 from functools import total_ordering
-from queue import PriorityQueue
+from itertools import count
 from timeit import default_timer
-from typing import Any, Literal, Optional
+from typing import Literal, Optional
 
 OPTIMIZATION = Literal['min', 'max']
 INIT = Literal['none', 'rand', 'greedy', 'dfs']
-
-
-@dataclass(order=True)
-class PrioritizedItem:
-    priority: int
-    item: Any = field(compare=False)
+QUEUE = Literal['best', 'depth', 'best_depth']
 
 
 @total_ordering
 class Solution(ABC):
-    def __init__(self, value: int, is_final: bool = False) -> None:
+    __slots__ = ('is_final', 'value', 'depth')
+
+    def __init__(self, value: int, is_final: bool = False, depth: int = 0) -> None:
         self.is_final = is_final
         self.value = value
+        self.depth = depth
 
     def __gt__(self, other: 'Solution') -> bool:
         return self.value > other.value
@@ -50,13 +48,84 @@ class Problem(ABC):
         pass
 
 
+class Frontier(ABC):
+    @abstractmethod
+    def push(self, priority: int, solution: Solution) -> None:
+        pass
+
+    @abstractmethod
+    def pop(self) -> Solution:
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def extend(self, items: list[tuple[int, Solution]]) -> None:
+        for priority, solution in items:
+            self.push(priority, solution)
+
+
+class BestFirstFrontier(Frontier):
+    # Lower priority first, ties are resolved in insertion order
+    def __init__(self) -> None:
+        self.heap = []
+        self.counter = count()
+
+    def push(self, priority: int, solution: Solution) -> None:
+        heapq.heappush(self.heap, (priority, next(self.counter), solution))
+
+    def pop(self) -> Solution:
+        return heapq.heappop(self.heap)[-1]
+
+    def __len__(self) -> int:
+        return len(self.heap)
+
+
+class BestDepthFirstFrontier(BestFirstFrontier):
+    # Lower priority first, ties are resolved in favour of deeper solutions
+    def push(self, priority: int, solution: Solution) -> None:
+        heapq.heappush(
+            self.heap, (priority, -solution.depth, next(self.counter), solution)
+        )
+
+
+class DepthFirstFrontier(Frontier):
+    def __init__(self) -> None:
+        self.stack = []
+
+    def push(self, priority: int, solution: Solution) -> None:
+        self.stack.append(solution)
+
+    def pop(self) -> Solution:
+        return self.stack.pop()
+
+    def __len__(self) -> int:
+        return len(self.stack)
+
+    def extend(self, items: list[tuple[int, Solution]]) -> None:
+        # Most promising solution is put on top of the stack
+        items = sorted(items, key=lambda i: i[0], reverse=True)
+        self.stack.extend(s for _, s in items)
+
+
+FRONTIERS: dict[str, type[Frontier]] = {
+    'best': BestFirstFrontier,
+    'depth': DepthFirstFrontier,
+    'best_depth': BestDepthFirstFrontier,
+}
+
+
 class Solver(ABC):
     def __init__(self, optimization_type: OPTIMIZATION) -> None:
         self.optimization_type = optimization_type
         self.best_solution = None
         self.solution_time = -1.0
+        self.nodes = 0
 
     def solve(self, problem: Problem) -> Optional[Solution]:
+        self.nodes = 0
+
         time_start = default_timer()
         solution = self._optimize(problem)
         time_end = default_timer()
@@ -70,6 +139,10 @@ class Solver(ABC):
         if self.solution_time > 0:
             print(separator_length * '=')
             print(f'Problem solved in {self.solution_time:.3f} seconds')
+            print(
+                f'Visited {self.nodes} nodes '
+                f'({self.nodes / self.solution_time:.0f} nodes/s)'
+            )
             print(separator_length * '-')
             print('Best found solution:')
             self.best_solution.visualize()
@@ -92,13 +165,16 @@ class Solver(ABC):
 
 class BranchAndBound(Solver):
     def __init__(
-        self, optimization_type: OPTIMIZATION, init_type: INIT, enqueue_limit: int = -1
+        self,
+        optimization_type: OPTIMIZATION,
+        init_type: INIT,
+        enqueue_limit: int = -1,
+        queue_type: QUEUE = 'best',
     ) -> None:
         super().__init__(optimization_type)
         self.init_type = init_type
-        self.queue: PriorityQueue[
-            PrioritizedItem
-        ] = PriorityQueue()  # lower priority first
+        self.queue_type = queue_type
+        self.queue = FRONTIERS[queue_type]()
         self.enqueue_limit = enqueue_limit
 
     def _optimize(self, problem: Problem) -> Optional[Solution]:
@@ -106,8 +182,10 @@ class BranchAndBound(Solver):
 
         self._develop_solution(problem)
 
-        while not self.queue.empty():
-            solution: Solution = self.queue.get().item
+        queue = self.queue
+        while queue:
+            solution = queue.pop()
+            self.nodes += 1
 
             if solution.is_final:
                 self._update_best_solution(solution)
@@ -129,15 +207,8 @@ class BranchAndBound(Solver):
             )
             pruned_solutions = pruned_solutions[: self.enqueue_limit]
 
-        for s in pruned_solutions:
-            self._enqueue_solution(s)
-
-    def _enqueue_solution(self, solution: Solution) -> None:
-        priority = (
-            -solution.value if self.optimization_type == 'max' else solution.value
-        )
-
-        self.queue.put(PrioritizedItem(priority, solution))
+        sign = -1 if self.optimization_type == 'max' else 1
+        self.queue.extend([(sign * s.value, s) for s in pruned_solutions])
 
     def _init_best_solution(self, problem: Problem) -> None:
         if self.init_type == 'rand':
@@ -171,6 +242,7 @@ class BruteForce(Solver):
 
         while self.queue:
             solution = self.queue.pop()
+            self.nodes += 1
 
             if solution.is_final:
                 self._update_best_solution(solution)
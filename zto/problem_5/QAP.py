@@ -1,6 +1,10 @@
+import random
 from functools import total_ordering
-from random import sample, shuffle
+from typing import Optional
 
+import numpy as np
+
+from ..lab.cache import get_instance
 from ..RNG import RandomNumberGenerator
 
 
@@ -25,60 +29,139 @@ class QAPSolution:
 
 class QAPProblem:
     def __init__(self, size: int, rnd_seed: int = 42) -> None:
-        rng = RandomNumberGenerator(rnd_seed)
         self.size = size
 
-        self.w = [[rng.nextInt(1, 50) for _ in range(size)] for _ in range(size)]
-        self.d = [[rng.nextInt(1, 50) for _ in range(size)] for _ in range(size)]
+        instance = get_instance(
+            type(self), (size, rnd_seed), lambda: self._generate(size, rnd_seed)
+        )
+        self.w = instance['w']
+        self.d = instance['d']
+        self._w_rows = self.w.tolist()
+        self._d_rows = self.d.tolist()
+
+    @staticmethod
+    def _generate(size: int, rnd_seed: int) -> dict:
+        rng = RandomNumberGenerator(rnd_seed)
+
+        w = rng.nextInts(1, 50, size * size).reshape(size, size)
+        d = rng.nextInts(1, 50, size * size).reshape(size, size)
+
+        return {'w': w, 'd': d}
 
-    def get_random_solution(self) -> QAPSolution:
+    # rng defaults to the global random module, chains running side by side
+    # pass their own random.Random instances
+    def get_random_solution(self, rng: Optional[random.Random] = None) -> QAPSolution:
         order = list(range(self.size))
-        shuffle(order)
+        (rng or random).shuffle(order)
 
         cost = self._evaluate_order(order)
 
         return QAPSolution(order, cost)
 
-    def get_random_neighbor(self, solution: QAPSolution) -> QAPSolution:
+    def get_random_neighbor(
+        self, solution: QAPSolution, rng: Optional[random.Random] = None
+    ) -> QAPSolution:
+        idx_a, idx_b = self.get_random_swap(rng)
+        delta = self.get_swap_delta(solution, idx_a, idx_b)
+
+        return self.swap(solution, idx_a, idx_b, delta)
+
+    def get_random_swap(self, rng: Optional[random.Random] = None) -> tuple[int, int]:
+        idx_a, idx_b = (rng or random).sample(list(range(self.size)), 2)
+
+        return idx_a, idx_b
+
+    def get_swap_delta(self, solution: QAPSolution, i: int, j: int) -> int:
+        # Cost change after swapping locations of facilities i and j in O(n),
+        # on list rows since a single swap is too small to pay off in NumPy
+        order = solution.order
+        w, d = self._w_rows, self._d_rows
+        pi, pj = order[i], order[j]
+        w_i, w_j = w[i], w[j]
+        d_i, d_j = d[pi], d[pj]
+
+        delta = (w_i[i] - w_j[j]) * (d_j[pj] - d_i[pi]) + (w_i[j] - w_j[i]) * (
+            d_j[pi] - d_i[pj]
+        )
+        for k, pk in enumerate(order):
+            if k == i or k == j:
+                continue
+            w_k, d_k = w[k], d[pk]
+            delta += (w_i[k] - w_j[k]) * (d_j[pk] - d_i[pk]) + (w_k[i] - w_k[j]) * (
+                d_k[pj] - d_k[pi]
+            )
+
+        return delta
+
+    def get_swap_deltas(self, solution: QAPSolution) -> np.ndarray:
+        # Cost changes of all swaps at once, element [i, j] holds the delta
+        # of swapping positions i and j (only i < j is meaningful)
+        order = np.asarray(solution.order)
+        w = self.w
+        d = self.d[order][:, order]
+        w_diag = w.diagonal()
+        d_diag = d.diagonal()
+
+        # Sums over all positions k of the row and column terms
+        a = w @ d.T
+        b = w.T @ d
+        a_diag = a.diagonal()
+        b_diag = b.diagonal()
+        full = (
+            a + a.T + b + b.T - (a_diag + b_diag)[:, None] - (a_diag + b_diag)[None, :]
+        )
+
+        # Terms for k = i and k = j are replaced by the swapped pair terms
+        k_i = (w_diag[:, None] - w.T) * (d.T - d_diag[:, None]) + (
+            w_diag[:, None] - w
+        ) * (d - d_diag[:, None])
+        k_j = (w - w_diag[None, :]) * (d_diag[None, :] - d) + (
+            w.T - w_diag[None, :]
+        ) * (d_diag[None, :] - d.T)
+        pair = (w_diag[:, None] - w_diag[None, :]) * (
+            d_diag[None, :] - d_diag[:, None]
+        ) + (w - w.T) * (d.T - d)
+
+        return full - k_i - k_j + pair
+
+    def get_best_swap(self, solution: QAPSolution) -> tuple[int, int, int]:
+        deltas = self.get_swap_deltas(solution)
+        idx_i, idx_j = np.triu_indices(self.size, 1)
+        pair_deltas = deltas[idx_i, idx_j]
+
+        best = pair_deltas.argmin()
+
+        return int(idx_i[best]), int(idx_j[best]), int(pair_deltas[best])
+
+    def swap(self, solution: QAPSolution, i: int, j: int, delta: int) -> QAPSolution:
         order = solution.order.copy()
+        order[i], order[j] = order[j], order[i]
 
-        idx_a, idx_b = sample(list(range(self.size)), 2)
-        order[idx_a], order[idx_b] = order[idx_b], order[idx_a]
-
-        cost = self._evaluate_order(order)
-
-        return QAPSolution(order, cost)
+        return QAPSolution(order, solution.cost + delta)
 
     def _evaluate_order(self, order: list[int]) -> int:
-        total_cost = 0
-        for fi, pi in enumerate(order):
-            for fj, pj in enumerate(order):
-                total_cost += self.w[fi][fj] * self.d[pi][pj]
+        order = np.asarray(order)
+        total_cost = (self.w * self.d[order][:, order]).sum()
 
-        return total_cost
+        return int(total_cost)
 
     def _get_all_neighbours(self, solution: QAPSolution) -> list[QAPSolution]:
         neighbours = []
         for i in range(self.size - 1):
             for j in range(i + 1, self.size):
-                order = solution.order.copy()
-                order[i], order[j] = order[j], order[i]
-
-                cost = self._evaluate_order(order)
-                new_solution = QAPSolution(order, cost)
-                neighbours.append(new_solution)
+                delta = self.get_swap_delta(solution, i, j)
+                neighbours.append(self.swap(solution, i, j, delta))
 
         return neighbours
 
-    def get_greedy_solution(self) -> QAPSolution:
-        solution = self.get_random_solution()
+    def get_greedy_solution(self, rng: Optional[random.Random] = None) -> QAPSolution:
+        solution = self.get_random_solution(rng)
 
         while True:
-            nb = self._get_all_neighbours(solution)
-            best = min(nb, key=lambda s: s.cost)
+            i, j, delta = self.get_best_swap(solution)
 
-            if best < solution:
-                solution = best
+            if delta < 0:
+                solution = self.swap(solution, i, j, delta)
             else:
                 break
 
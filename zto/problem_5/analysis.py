@@ -1,20 +1,18 @@
 # %%
-import pickle as pkl
-
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from tabulate import tabulate
 
 # %%
+from ..lab import Experiment, Lab, load_results
 from .environment import Environment
-from .experiment import Experiment, Lab
 
 SEEDS = [81178, 34091, 75746, 65927, 1173, 70912, 19419, 50363, 82748, 4511]
 # %%
 
 
-def run_lab():
+def run_lab(workers: int = 1, resume: bool = False):
     lab = Lab(
         name='p5',
         env_cls=Environment,
@@ -64,22 +62,21 @@ def run_lab():
     )
     lab.add_experiment(e5)
 
-    lab.run()
+    lab.run(workers, resume)
 
 
 def report():
     files = [
-        './results/p5_geo.pkl',
-        './results/p5_lin.pkl',
-        './results/p5_rnd_inits.pkl',
-        './results/p5_rnd.pkl',
-        './results/p5_sa_inits.pkl',
+        './results/p5_geo.npz',
+        './results/p5_lin.npz',
+        './results/p5_rnd_inits.npz',
+        './results/p5_rnd.npz',
+        './results/p5_sa_inits.npz',
     ]
     data = []
     for name in files:
-        with open(name, 'rb') as f:
-            d = pkl.load(f)
-            data.append(d)
+        d = load_results(name)
+        data.append(d)
     dfs = [pd.DataFrame(d) for d in data]
 
     r0 = _process_results(dfs[0])
@@ -110,10 +107,13 @@ def report():
 
 
 def _list_mean_agg(series):
-    results = []
-    for result in series:
-        results.append(np.array(result))
-    results = np.vstack(results).mean(axis=0)
+    # Histories of different seeds have different lengths, shorter ones are
+    # padded with their last (best) value
+    results = [np.asarray(result) for result in series]
+    length = max(len(result) for result in results)
+    results = np.vstack(
+        [np.pad(result, (0, length - len(result)), mode='edge') for result in results]
+    ).mean(axis=0)
     return results.tolist()
 
 
@@ -2,7 +2,7 @@ import random
 
 from zto.problem_5.QAP import QAPProblem
 
-from .solver import INIT_LITERAL, UPDATE_LITERAL, RandomSolver
+from .solver import INIT_LITERAL, UPDATE_LITERAL, MultiStartSolver, RandomSolver
 
 
 class Environment:
@@ -16,17 +16,31 @@ class Environment:
         temperature_change: float,
         seed: int,
         problem_seed: int,
+        chains: int = 1,
+        exchange_interval: int = -1,
     ) -> None:
         random.seed(seed)
 
         self.problem = QAPProblem(problem_size, problem_seed)
-        self.solver = RandomSolver(
-            initialization_type,
-            iteration_limit,
-            annealing,
-            temperature_update,
-            temperature_change,
-        )
+        solver_args = {
+            'initialization': initialization_type,
+            'iteration_limit': iteration_limit,
+            'annealing': annealing,
+            'temperature_update': temperature_update,
+            'temperature_change': temperature_change,
+        }
+        if chains > 1:
+            self.solver = MultiStartSolver(
+                chains, exchange_interval=exchange_interval, seed=seed, **solver_args
+            )
+        else:
+            self.solver = RandomSolver(**solver_args)
 
     def run(self) -> None:
         self.solver.solve(self.problem)
+
+    def get_metrics(self) -> dict:
+        return {
+            'time': self.solver.solution_time,
+            'results': [s.cost for s in self.solver.best_history],
+        }
@@ -1,7 +1,9 @@
 import math
 import random
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from timeit import default_timer
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Literal, Optional
 
 if TYPE_CHECKING:
     from .QAP import QAPProblem, QAPSolution
@@ -18,6 +20,7 @@ class RandomSolver:
         annealing: bool = False,
         temperature_update: UPDATE_LITERAL = 'geo',
         temperature_change: float = 0.9,
+        rng: Optional[random.Random] = None,
     ) -> None:
         self.initialization = initialization
 
@@ -27,6 +30,9 @@ class RandomSolver:
         self.temperature_update = temperature_update
         self.temperature_change = temperature_change
 
+        # Global random module unless the chain gets its own generator
+        self.rng = rng or random
+
         self.best_history: list[QAPSolution] = []
 
     def _stop_condition_not_met(self) -> bool:
@@ -38,7 +44,7 @@ class RandomSolver:
         return iteration_limit
 
     def _init_temperature(self, problem: 'QAPProblem') -> None:
-        problems = [problem.get_random_solution() for _ in range(1000)]
+        problems = [problem.get_random_solution(self.rng) for _ in range(1000)]
         p_max = max(problems, key=lambda p: p.cost)
         p_min = min(problems, key=lambda p: p.cost)
 
@@ -49,13 +55,10 @@ class RandomSolver:
     def _clamp(self, val: float) -> float:
         return max(-50, min(50, val))
 
-    def _accept(self, solution: 'QAPSolution') -> bool:
-        last_val = self.current_solution.cost
-        new_val = solution.cost
-
-        exponent = -(new_val - last_val) / self.temperature
+    def _accept(self, delta: int) -> bool:
+        exponent = -delta / self.temperature
         threshold = math.e ** self._clamp(exponent)
-        return random.random() < threshold
+        return self.rng.random() < threshold
 
     def _update_temperature(self) -> None:
         if self.temperature_update == 'geo':
@@ -65,14 +68,14 @@ class RandomSolver:
 
     def _init_solution(self, problem: 'QAPProblem') -> None:
         if self.initialization == 'rnd':
-            init_solution = problem.get_random_solution()
+            init_solution = problem.get_random_solution(self.rng)
             self._set_new_best_solution(init_solution)
         elif self.initialization == 'best':
-            solutions = [problem.get_random_solution() for _ in range(100)]
+            solutions = [problem.get_random_solution(self.rng) for _ in range(100)]
             init_solution = min(solutions, key=lambda s: s.cost)
             self._set_new_best_solution(init_solution)
         elif self.initialization == 'greedy':
-            solution = problem.get_greedy_solution()
+            solution = problem.get_greedy_solution(self.rng)
             self._set_new_best_solution(solution)
 
         self.current_solution = self.best_solution
@@ -81,24 +84,133 @@ class RandomSolver:
         self.best_history.append(new_best)
         self.best_solution = new_best
 
-    def _solve(self, problem: 'QAPProblem') -> 'QAPSolution':
+    def adopt(self, solution: 'QAPSolution') -> None:
+        # Continue the chain from a solution found elsewhere
+        if solution.cost < self.best_solution.cost:
+            self._set_new_best_solution(solution)
+        self.current_solution = solution
+
+    def _start(self, problem: 'QAPProblem') -> None:
         if self.annealing:
             self._init_temperature(problem)
 
         self._init_solution(problem)
         self.iteration = 0
-        while self._stop_condition_not_met():
-            new_solution = problem.get_random_neighbor(self.current_solution)
-            if new_solution < self.best_solution:
+
+    def _run(self, problem: 'QAPProblem', iterations: int = -1) -> None:
+        stop = self.iteration + iterations
+        while self._stop_condition_not_met() and (
+            iterations <= 0 or self.iteration < stop
+        ):
+            # Neighbour is evaluated by its cost delta and only materialized
+            # when it is accepted
+            idx_a, idx_b = problem.get_random_swap(self.rng)
+            delta = problem.get_swap_delta(self.current_solution, idx_a, idx_b)
+            new_cost = self.current_solution.cost + delta
+            if new_cost < self.best_solution.cost:
+                new_solution = problem.swap(self.current_solution, idx_a, idx_b, delta)
                 self._set_new_best_solution(new_solution)
                 self.current_solution = new_solution
-            elif self.annealing and self._accept(new_solution):
-                self.current_solution = new_solution
+            elif self.annealing and self._accept(delta):
+                self.current_solution = problem.swap(
+                    self.current_solution, idx_a, idx_b, delta
+                )
 
             if self.annealing:
                 self._update_temperature()
             self.iteration += 1
 
+    def _solve(self, problem: 'QAPProblem') -> 'QAPSolution':
+        self._start(problem)
+        self._run(problem)
+
+        return self.best_solution
+
+    def solve(self, problem: 'QAPProblem') -> 'QAPSolution':
+        time_start = default_timer()
+        solution = self._solve(problem)
+        time_end = default_timer()
+
+        self.solution_time = time_end - time_start
+
+        return solution
+
+
+def _start_chain(
+    solver: RandomSolver, problem: 'QAPProblem', iterations: int
+) -> RandomSolver:
+    solver._start(problem)
+    solver._run(problem, iterations)
+
+    return solver
+
+
+def _run_chain(
+    solver: RandomSolver, problem: 'QAPProblem', iterations: int
+) -> RandomSolver:
+    solver._run(problem, iterations)
+
+    return solver
+
+
+class MultiStartSolver:
+    # Independent chains in a process pool, each with its own random.Random.
+    # With exchange_interval > 0 chains stop every exchange_interval iterations
+    # and continue from the best solution found so far (island model).
+    def __init__(
+        self,
+        chains: int = 8,
+        workers: Optional[int] = None,
+        exchange_interval: int = -1,
+        seed: Optional[int] = None,
+        **solver_args,
+    ) -> None:
+        self.chains = chains
+        self.workers = workers
+        self.exchange_interval = exchange_interval
+        self.seed = seed
+        self.solver_args = solver_args
+
+        self.best_history: list[QAPSolution] = []
+
+    def _merge_history(self, solvers: list[RandomSolver]) -> None:
+        # Improvements of all chains from the last epoch, best-so-far only
+        found = sorted(
+            (s for solver in solvers for s in solver.best_history),
+            key=lambda s: s.cost,
+            reverse=True,
+        )
+        for solution in found:
+            if not self.best_history or solution.cost < self.best_solution.cost:
+                self.best_history.append(solution)
+                self.best_solution = solution
+
+        for solver in solvers:
+            solver.best_history.clear()
+
+    def _solve(self, problem: 'QAPProblem') -> 'QAPSolution':
+        seeder = random.Random(self.seed)
+        solvers = [
+            RandomSolver(**self.solver_args, rng=random.Random(seeder.getrandbits(64)))
+            for _ in range(self.chains)
+        ]
+        interval = self.exchange_interval
+
+        with ProcessPoolExecutor(self.workers) as executor:
+            chain = _start_chain
+            while True:
+                solvers = list(
+                    executor.map(chain, solvers, repeat(problem), repeat(interval))
+                )
+                self._merge_history(solvers)
+
+                if not any(s._stop_condition_not_met() for s in solvers):
+                    break
+
+                for solver in solvers:
+                    solver.adopt(self.best_solution)
+                chain = _run_chain
+
         return self.best_solution
 
     def solve(self, problem: 'QAPProblem') -> 'QAPSolution':
@@ -1,4 +1,5 @@
 import random
+from itertools import accumulate
 
 from .DKP import DKProblem, DKSolution
 
@@ -67,10 +68,12 @@ class ABCSolver:
 
             # Obserwatorzy
             # Sprawdzanie kolejnych rozwiązań z naciskiem na najlepsze
-            for i in range(self.population):
-                exp_solution = random.sample(
-                    solutions, 1, counts=[s.solution.value for s in solutions]
-                )[0]
+            # (koło ruletki budowane raz na iterację)
+            cum_values = list(accumulate(s.solution.value for s in solutions))
+            exp_solutions = random.choices(
+                solutions, cum_weights=cum_values, k=self.population
+            )
+            for exp_solution in exp_solutions:
                 self.try_solution_neighbor(problem, exp_solution)
 
             # Zwiadowcy
@@ -1,36 +1,67 @@
 import random
 from functools import total_ordering
-from typing import Literal
-
-import numpy as np
+from typing import Iterable, Iterator, Literal
 
+from ..lab.cache import get_instance
 from ..RNG import RandomNumberGenerator as RNG
 
 NB_TYPE = Literal['nb', 'gen']
 
 
+def _iter_items(selected: int) -> Iterator[int]:
+    # Przedmioty zakodowane w masce bitowej (rosnąco)
+    while selected:
+        low_bit = selected & -selected
+        yield low_bit.bit_length() - 1
+        selected ^= low_bit
+
+
+def _items_to_bin(items: Iterable[int]) -> int:
+    # Transformacja zbiór przedmiotów -> maska bitowa
+    selected = 0
+    for it in items:
+        selected |= 1 << it
+
+    return selected
+
+
 class DKProblem:
     def __init__(self, items: int, nb_type: NB_TYPE = 'nb', rnd_seed: int = 42) -> None:
-        self.rgen = RNG(rnd_seed)
         self.items = items
         self.nb_type = nb_type
 
+        instance = get_instance(
+            type(self), (items, rnd_seed), lambda: self._generate(items, rnd_seed)
+        )
         # Wartość
-        self.c = [self.rgen.nextInt(1, 30) for _ in range(items)]
+        self.c = instance['c']
         # Waga
-        self.w = [self.rgen.nextInt(1, 30) for _ in range(items)]
+        self.w = instance['w']
         # Pojemność
-        self.b = self.rgen.nextInt(5 * items, 10 * items)
+        self.b = instance['b']
 
-    def evaluate_selection_value(self, selected: set[int]) -> int:
+        # Maska wszystkich przedmiotów
+        self.all_selected = (1 << items) - 1
+
+    @staticmethod
+    def _generate(items: int, rnd_seed: int) -> dict:
+        rgen = RNG(rnd_seed)
+
+        c = rgen.nextInts(1, 30, items).tolist()
+        w = rgen.nextInts(1, 30, items).tolist()
+        b = rgen.nextInt(5 * items, 10 * items)
+
+        return {'c': c, 'w': w, 'b': b}
+
+    def evaluate_selection_value(self, selected: int) -> int:
         # Wartość wybranych przedmiotów
-        value = sum([self.c[idx] for idx in selected])
+        value = sum([self.c[idx] for idx in _iter_items(selected)])
 
         return value
 
-    def evaluate_selection_weight(self, selected: set[int]) -> int:
+    def evaluate_selection_weight(self, selected: int) -> int:
         # Waga wybranych przedmiotów
-        weight = sum([self.w[idx] for idx in selected])
+        weight = sum([self.w[idx] for idx in _iter_items(selected)])
 
         return weight
 
@@ -38,40 +69,73 @@ class DKProblem:
         # Czy mieści się w torbie
         return weight <= self.b
 
-    def selected_to_solution(self, selected: set[int]) -> 'DKSolution':
-        # Tworzy rozwiązanie z ciągu wybranych przedmiotów
+    def selected_to_solution(self, selected: int) -> 'DKSolution':
+        # Tworzy rozwiązanie z maski bitowej wybranych przedmiotów
         value = self.evaluate_selection_value(selected)
         weight = self.evaluate_selection_weight(selected)
         in_bounds = self.is_in_bounds(weight)
+        count = bin(selected).count('1')
 
-        new_solution = DKSolution(selected, value, weight, in_bounds)
+        new_solution = DKSolution(selected, value, weight, in_bounds, count)
 
         return new_solution
 
-    def get_not_selected(self, selected: set[int]) -> list[int]:
+    def add_item(self, solution: 'DKSolution', item: int) -> 'DKSolution':
+        # Dodanie przedmiotu w O(1)
+        weight = solution.weight + self.w[item]
+
+        return DKSolution(
+            solution.selected | (1 << item),
+            solution.value + self.c[item],
+            weight,
+            self.is_in_bounds(weight),
+            solution.count + 1,
+        )
+
+    def drop_item(self, solution: 'DKSolution', item: int) -> 'DKSolution':
+        # Usunięcie przedmiotu w O(1)
+        weight = solution.weight - self.w[item]
+
+        return DKSolution(
+            solution.selected & ~(1 << item),
+            solution.value - self.c[item],
+            weight,
+            self.is_in_bounds(weight),
+            solution.count - 1,
+        )
+
+    def swap_items(
+        self, solution: 'DKSolution', item: int, new_item: int
+    ) -> 'DKSolution':
+        # Podmiana przedmiotu na niewybrany w O(1)
+        weight = solution.weight - self.w[item] + self.w[new_item]
+
+        return DKSolution(
+            solution.selected & ~(1 << item) | (1 << new_item),
+            solution.value - self.c[item] + self.c[new_item],
+            weight,
+            self.is_in_bounds(weight),
+            solution.count,
+        )
+
+    def get_not_selected(self, selected: int) -> list[int]:
         # Odwrotność zbioru wybranych przedmiotów
-        not_selected = list(filter(lambda it: it not in selected, range(self.items)))
+        not_selected = list(_iter_items(~selected & self.all_selected))
 
         return not_selected
 
     def get_full_neighborhood(self, solution: 'DKSolution') -> list['DKSolution']:
         # Podaj wszystkich sąsiadów rozwiązania
+        selected = list(_iter_items(solution.selected))
         not_selected = self.get_not_selected(solution.selected)
 
         nb_solutions = []
-        for it in solution.selected:
+        for it in selected:
             for n_it in not_selected:
-                new_selected = solution.selected.copy()
-                new_selected.remove(it)
-                new_selected.add(n_it)
-
-                new_solution = self.selected_to_solution(new_selected)
+                new_solution = self.swap_items(solution, it, n_it)
                 nb_solutions.append(new_solution)
         for n_it in not_selected:
-            new_selected = solution.selected.copy()
-            new_selected.add(n_it)
-
-            new_solution = self.selected_to_solution(new_selected)
+            new_solution = self.add_item(solution, n_it)
             nb_solutions.append(new_solution)
 
         return nb_solutions
@@ -91,67 +155,48 @@ class DKProblem:
         while solution == s2:
             s2 = self.get_random_solution()
 
-        gen1 = self._selected_to_bin(solution.selected)
-        gen2 = self._selected_to_bin(s2.selected)
-
-        ngen = self._combine_bin(gen1, gen2)
-
-        new_selected = self._bin_to_selected(ngen)
+        new_selected = self._combine_bin(solution.selected, s2.selected)
         new_solution = self.selected_to_solution(new_selected)
 
         return new_solution
 
-    def _combine_bin(self, g1: np.ndarray, g2: np.ndarray) -> np.ndarray:
+    def _combine_bin(self, g1: int, g2: int) -> int:
         # Połączenie rozwiązań w postaci binarnej (cięcie na pół)
-        cut = self.items // 2
-
-        ng1 = g1[:cut]
-        ng2 = g2[cut:]
-
-        ng = np.concatenate([ng1, ng2])
-        return ng
-
-    def _selected_to_bin(self, selected: set[int]) -> np.ndarray:
-        # Transformacja zbiór przedmiotów -> postać binarna
-        bin = np.zeros(self.items)
-        selected_idx = np.array(list(selected))
-
-        bin[selected_idx] = 1
-        return bin
+        cut_mask = (1 << (self.items // 2)) - 1
 
-    def _bin_to_selected(self, bin: np.ndarray) -> set[int]:
-        # Transformacja postać binarna -> zbiór przedmiotów
-        selected = set(np.where(bin == 1)[0])
+        return (g1 & cut_mask) | (g2 & ~cut_mask)
 
-        return selected
+    def _random_item(self, selected: int, is_selected: bool) -> int:
+        # Losowy przedmiot (wybrany lub nie) - losowanie z odrzuceniem
+        while True:
+            item = random.randrange(self.items)
+            if bool(selected >> item & 1) == is_selected:
+                return item
 
     def get_random_neighbor(self, solution: 'DKSolution') -> 'DKSolution':
         # Losowy sąsiad danego rozwiązania
-        not_selected = self.get_not_selected(solution.selected)
-
-        new_item = random.choice(not_selected)
-        replace_it = random.choice(list(solution.selected | {None}))
+        if solution.count == self.items:
+            # Brak przedmiotów do dodania
+            return self.drop_item(solution, random.randrange(self.items))
 
-        new_selected = solution.selected.copy()
-        if replace_it is not None:
-            new_selected.remove(replace_it)
+        new_item = self._random_item(solution.selected, False)
+        if random.randrange(solution.count + 1) == solution.count:
+            return self.add_item(solution, new_item)
 
-        new_selected.add(new_item)
+        replace_it = self._random_item(solution.selected, True)
 
-        new_solution = self.selected_to_solution(new_selected)
-
-        return new_solution
+        return self.swap_items(solution, replace_it, new_item)
 
     def get_random_solution(self, allow_out_of_bounds: bool = False) -> 'DKSolution':
         # Losowe rozwiązanie
         s_len = random.randint(1, self.items)
 
-        selected = set(random.sample(range(self.items), s_len))
+        selected = _items_to_bin(random.sample(range(self.items), s_len))
         solution = self.selected_to_solution(selected)
         if not allow_out_of_bounds:
             while not solution.in_bounds:
                 s_len = random.randint(1, self.items)
-                selected = set(random.sample(range(self.items), s_len))
+                selected = _items_to_bin(random.sample(range(self.items), s_len))
                 solution = self.selected_to_solution(selected)
 
         return solution
@@ -171,12 +216,14 @@ class DKProblem:
 @total_ordering
 class DKSolution:
     def __init__(
-        self, selected: set[int], value: int, weight: int, in_bounds: bool
+        self, selected: int, value: int, weight: int, in_bounds: bool, count: int
     ) -> None:
+        # selected - maska bitowa wybranych przedmiotów
         self.selected = selected
         self.value = value
         self.weight = weight
         self.in_bounds = in_bounds
+        self.count = count
 
     def __eq__(self, other: 'DKSolution') -> bool:
         return self.selected == other.selected
@@ -199,4 +246,4 @@ class DKSolution:
         print(f'Total weight: {self.weight:10}')
         print(40 * '-')
         print('Selected items:')
-        print(self.selected)
+        print(list(_iter_items(self.selected)))
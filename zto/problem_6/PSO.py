@@ -22,9 +22,12 @@ class PSOSolver:
         self.iteration_limit = iteration_limit
         self.no_progress_limit = no_progress_limit
 
-    def update_best_solution(self, solution: SphereSolution) -> None:
-        if solution < self.best_solution:
-            self.best_solution = solution
+    def update_best_solution(self, swarm: 'Swarm') -> None:
+        idx = swarm.best_local_value.argmin()
+        if swarm.best_local_value[idx] < self.best_solution.value:
+            self.best_solution = SphereSolution(
+                swarm.best_local[idx].copy(), swarm.best_local_value[idx]
+            )
             self.no_progress = 0
 
     def should_stop(self) -> bool:
@@ -35,77 +38,69 @@ class PSOSolver:
         return False
 
     def solve(self, problem: SphereProblem) -> SphereSolution:
-        solutions = [
-            PSOSolution(
-                problem.get_random_solution(), problem.upper_bound, problem.lower_bound
-            )
-            for _ in range(self.population)
-        ]
-        self.best_solution = solutions[0].solution
+        swarm = Swarm(self.population, problem)
 
-        for s in solutions:
-            self.update_best_solution(s.solution)
+        idx = swarm.value.argmin()
+        self.best_solution = SphereSolution(
+            swarm.position[idx].copy(), swarm.value[idx]
+        )
 
         self.iteration = 0
         self.no_progress = 0
         while not self.should_stop():
             self.iteration += 1
             self.no_progress += 1
-            for s in solutions:
-                rnd_local = np.random.random(problem.vars)
-                rnd_global = np.random.random(problem.vars)
-                s.update_velocity(
-                    self.omega,
-                    self.phi_local,
-                    rnd_local,
-                    self.phi_global,
-                    rnd_global,
-                    self.best_solution,
-                )
-                new_solution = s.update_position(self.learning_rate, problem)
-                self.update_best_solution(new_solution)
+
+            swarm.update_velocity(
+                self.omega,
+                self.phi_local,
+                self.phi_global,
+                self.best_solution,
+            )
+            swarm.update_position(self.learning_rate, problem)
+            self.update_best_solution(swarm)
 
         return self.best_solution
 
 
-class PSOSolution:
-    def __init__(
-        self,
-        solution: SphereSolution,
-        upper_bound: float,
-        lower_bound: float,
-    ) -> None:
-        self.solution = solution
-        self.best_local = solution
+class Swarm:
+    # Whole population kept as (population, vars) matrices
+    def __init__(self, population: int, problem: SphereProblem) -> None:
+        shape = (population, problem.vars)
+
+        self.position = (
+            np.random.random(shape) * (problem.upper_bound - problem.lower_bound)
+            + problem.lower_bound
+        )
+        self.value = problem.evaluate_batch(self.position)
 
-        u = lower_bound - upper_bound
-        l = upper_bound - lower_bound
-        self.velocity = np.random.random(len(solution.values)) * (u - l) + l
+        self.best_local = self.position.copy()
+        self.best_local_value = self.value.copy()
+
+        u = problem.lower_bound - problem.upper_bound
+        l = problem.upper_bound - problem.lower_bound
+        self.velocity = np.random.random(shape) * (u - l) + l
 
     def update_velocity(
         self,
         omega: float,
         phi_local: float,
-        rnd_local: np.ndarray,
         phi_global: float,
-        rnd_global: np.ndarray,
         best_solution: SphereSolution,
     ) -> None:
-        self.velocity = (
-            self.velocity * omega
-            + phi_local * rnd_local * (self.best_local.values - self.solution.values)
-            + phi_global * rnd_global * (best_solution.values - self.solution.values)
-        )
+        rnd_local = np.random.random(self.position.shape)
+        rnd_global = np.random.random(self.position.shape)
 
-    def update_position(
-        self, learning_rate: float, problem: SphereProblem
-    ) -> SphereSolution:
-        new_values = self.solution.values + learning_rate * self.velocity
-        new_value = problem.evaluate_values(new_values)
-        new_solution = SphereSolution(new_values, new_value)
+        self.velocity *= omega
+        self.velocity += phi_local * rnd_local * (self.best_local - self.position)
+        self.velocity += (
+            phi_global * rnd_global * (best_solution.values - self.position)
+        )
 
-        self.solution = new_solution
-        if new_solution < self.best_local:
-            self.best_local = new_solution
+    def update_position(self, learning_rate: float, problem: SphereProblem) -> None:
+        self.position += learning_rate * self.velocity
+        self.value = problem.evaluate_batch(self.position)
 
-        return new_solution
+        improved = self.value < self.best_local_value
+        self.best_local[improved] = self.position[improved]
+        self.best_local_value[improved] = self.value[improved]
@@ -1,17 +1,15 @@
 # %%
-import pickle as pkl
-
 import matplotlib.pyplot as plt
 import numpy as np
 import pandas as pd
 from tabulate import tabulate
+from zto.lab import Experiment, Lab, load_results
 from zto.problem_6.environment import ABCEnvironment
-from zto.problem_6.experiment import Experiment, Lab
 
 SEEDS = [81178, 34091, 75746, 65927, 1173, 70912, 19419, 50363, 82748, 4511]
 
 # %%
-def run_lab():
+def run_lab(workers: int = 1, resume: bool = False):
     lab = Lab(
         name='p6abc',
         repetitions=1,
@@ -41,7 +39,7 @@ def run_lab():
     )
     lab.add_experiment(e2)
 
-    lab.run()
+    lab.run(workers, resume)
 
 
 # %%
@@ -58,15 +56,14 @@ def _process(x: pd.DataFrame) -> np.ndarray:
 
 def report():
     files = [
-        './results/p6abc_nb_gen.pkl',
-        './results/p6abc_nb_gen.pkl',
+        './results/p6abc_nb_gen.npz',
+        './results/p6abc_nb_gen.npz',
     ]
 
     data = []
     for name in files:
-        with open(name, 'rb') as f:
-            d = pkl.load(f)
-            data.append(d)
+        d = load_results(name)
+        data.append(d)
     dfs = [pd.DataFrame(d) for d in data]
 
     x1 = dfs[0][['var_val', 'results']]
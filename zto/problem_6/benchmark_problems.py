@@ -0,0 +1,54 @@
+import numpy as np
+from zto.problem_6.sphere_problem import SphereProblem
+
+
+class RastriginProblem(SphereProblem):
+    name = 'Rastrigin function'
+
+    def __init__(
+        self, vars: int, upper_bound: float = 5.12, lowe_bound: float = -5.12
+    ) -> None:
+        super().__init__(vars, upper_bound, lowe_bound)
+
+    def evaluate_batch(self, values: np.ndarray) -> np.ndarray:
+        terms = values ** 2 - 10 * np.cos(2 * np.pi * values)
+
+        return 10 * self.vars + terms.sum(axis=1)
+
+
+class RosenbrockProblem(SphereProblem):
+    name = 'Rosenbrock function'
+
+    def __init__(
+        self, vars: int, upper_bound: float = 5, lowe_bound: float = -5
+    ) -> None:
+        super().__init__(vars, upper_bound, lowe_bound)
+
+    def evaluate_batch(self, values: np.ndarray) -> np.ndarray:
+        head = values[:, :-1]
+        tail = values[:, 1:]
+
+        return (100 * (tail - head ** 2) ** 2 + (1 - head) ** 2).sum(axis=1)
+
+
+class AckleyProblem(SphereProblem):
+    name = 'Ackley function'
+
+    def __init__(
+        self, vars: int, upper_bound: float = 32.768, lowe_bound: float = -32.768
+    ) -> None:
+        super().__init__(vars, upper_bound, lowe_bound)
+
+    def evaluate_batch(self, values: np.ndarray) -> np.ndarray:
+        mean_sq = (values ** 2).mean(axis=1)
+        mean_cos = np.cos(2 * np.pi * values).mean(axis=1)
+
+        return -20 * np.exp(-0.2 * np.sqrt(mean_sq)) - np.exp(mean_cos) + 20 + np.e
+
+
+PROBLEMS: dict[str, type[SphereProblem]] = {
+    'sphere': SphereProblem,
+    'rastrigin': RastriginProblem,
+    'rosenbrock': RosenbrockProblem,
+    'ackley': AckleyProblem,
+}
@@ -25,3 +25,6 @@ class ABCEnvironment:
 
     def run(self) -> None:
         self.solver.solve(self.problem)
+
+    def get_metrics(self) -> dict:
+        return {'results': self.solver.best_history}
@@ -4,6 +4,8 @@ import numpy as np
 
 
 class SphereProblem:
+    name = 'Sphere function'
+
     def __init__(
         self, vars: int, upper_bound: float = 100, lowe_bound: float = -100
     ) -> None:
@@ -22,13 +24,17 @@ class SphereProblem:
         return solution
 
     def evaluate_values(self, values: np.ndarray) -> float:
-        value = (values ** 2).sum()
+        value = self.evaluate_batch(values[np.newaxis])[0]
 
         return value
 
+    def evaluate_batch(self, values: np.ndarray) -> np.ndarray:
+        # Values of k solutions given as a (k, vars) array
+        return (values ** 2).sum(axis=1)
+
     def visualize(self) -> None:
         print(40 * '=')
-        print('Sphere function')
+        print(self.name)
         print(40 * '=')
         print(f'Variables: {self.vars}')
 
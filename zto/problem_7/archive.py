@@ -0,0 +1,85 @@
+from bisect import bisect_left
+
+import numpy as np
+
+from .pareto import crowding_distance
+from .problem import FlowSolution
+
+
+class ParetoArchive:
+    # Archiwum rozwiązań niezdominowanych aktualizowane przy każdym dodaniu,
+    # capacity > 0 ogranicza rozmiar usuwając najbardziej zatłoczone punkty
+    def __init__(self, criterions: list[str], capacity: int = -1) -> None:
+        self.criterions = criterions
+        self.capacity = capacity
+
+        self.points: list[tuple] = []
+        self.archived: list[FlowSolution] = []
+
+    @property
+    def solutions(self) -> list[FlowSolution]:
+        return self.archived.copy()
+
+    def __len__(self) -> int:
+        return len(self.archived)
+
+    def add(self, solution: FlowSolution) -> bool:
+        point = tuple(solution.state[c] for c in self.criterions)
+
+        if len(self.criterions) == 2:
+            added = self._add_2d(point, solution)
+        else:
+            added = self._add_kd(point, solution)
+
+        if added and 0 < self.capacity < len(self.archived):
+            self._prune()
+
+        return added
+
+    def _add_2d(self, point: tuple, solution: FlowSolution) -> bool:
+        # Punkty posortowane rosnąco po pierwszym kryterium (malejąco po drugim)
+        x, y = point
+        idx = bisect_left(self.points, (x,))
+        if idx > 0 and self.points[idx - 1][1] <= y:
+            return False
+        if idx < len(self.points) and self.points[idx][0] == x:
+            if self.points[idx][1] < y:
+                return False
+
+        # Pominięcie identycznych punktów i usunięcie zdominowanych
+        start = idx
+        while start < len(self.points) and self.points[start] == point:
+            start += 1
+        end = start
+        while end < len(self.points) and self.points[end][1] >= y:
+            end += 1
+
+        self.points[start:end] = [point]
+        self.archived[start:end] = [solution]
+
+        return True
+
+    def _add_kd(self, point: tuple, solution: FlowSolution) -> bool:
+        if self.points:
+            points = np.array(self.points)
+            p = np.array(point)
+
+            if ((points <= p).all(axis=1) & (points < p).any(axis=1)).any():
+                return False
+
+            dominated = (p <= points).all(axis=1) & (p < points).any(axis=1)
+            if dominated.any():
+                self.points = [pt for pt, d in zip(self.points, dominated) if not d]
+                self.archived = [s for s, d in zip(self.archived, dominated) if not d]
+
+        self.points.append(point)
+        self.archived.append(solution)
+
+        return True
+
+    def _prune(self) -> None:
+        distance = crowding_distance(np.array(self.points))
+        idx = int(distance.argmin())
+
+        del self.points[idx]
+        del self.archived[idx]
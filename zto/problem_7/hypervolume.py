@@ -0,0 +1,104 @@
+from bisect import bisect_left
+
+import numpy as np
+
+from .pareto import non_dominated
+
+# Hiperobjętość obszaru zdominowanego przez punkty (minimalizacja),
+# ograniczonego punktem referencyjnym
+
+MC_SAMPLES = 100_000
+MC_CHUNK = 10_000
+
+
+def _hypervolume_2d(points: np.ndarray, reference: np.ndarray) -> float:
+    # Punkty niezdominowane posortowane rosnąco po x (malejąco po y)
+    points = points[points[:, 0].argsort()]
+    x, y = points[:, 0], points[:, 1]
+    prev_y = np.r_[reference[1], y[:-1]]
+
+    return float(((reference[0] - x) * (prev_y - y)).sum())
+
+
+def _hypervolume_3d(points: np.ndarray, reference: np.ndarray) -> float:
+    # Przeszukanie po trzecim kryterium z utrzymywaniem frontu 2D
+    # i jego pola powierzchni (HV3D)
+    points = points[points[:, 2].argsort()]
+    r1, r2, r3 = reference
+
+    xs, ys = [], []
+    area = 0.0
+    volume = 0.0
+    for i, (x, y, z) in enumerate(points):
+        idx = bisect_left(xs, x)
+        dominated = (idx > 0 and ys[idx - 1] <= y) or (
+            idx < len(xs) and xs[idx] == x and ys[idx] <= y
+        )
+        if not dominated:
+            left_y = ys[idx - 1] if idx > 0 else r2
+
+            # Usunięcie punktów zdominowanych przez nowy punkt
+            end = idx
+            prev_y = left_y
+            while end < len(xs) and ys[end] >= y:
+                area -= (r1 - xs[end]) * (prev_y - ys[end])
+                prev_y = ys[end]
+                end += 1
+
+            if end < len(xs):
+                area -= (r1 - xs[end]) * (prev_y - ys[end])
+                area += (r1 - xs[end]) * (y - ys[end])
+            area += (r1 - x) * (left_y - y)
+
+            xs[idx:end] = [x]
+            ys[idx:end] = [y]
+
+        next_z = points[i + 1, 2] if i + 1 < len(points) else r3
+        volume += area * (next_z - z)
+
+    return float(volume)
+
+
+def _hypervolume_mc(
+    points: np.ndarray, reference: np.ndarray, samples: int, seed: int
+) -> float:
+    # Estymacja Monte Carlo w prostopadłościanie [min(points), reference]
+    rng = np.random.default_rng(seed)
+    lower = points.min(axis=0)
+    box_volume = np.prod(reference - lower)
+
+    hits = 0
+    for start in range(0, samples, MC_CHUNK):
+        size = min(MC_CHUNK, samples - start)
+        sample = rng.uniform(lower, reference, (size, len(reference)))
+        is_dominated = np.zeros(size, dtype=bool)
+        for p in points:
+            is_dominated |= (p <= sample).all(axis=1)
+        hits += is_dominated.sum()
+
+    return float(box_volume * hits / samples)
+
+
+def hypervolume(
+    points: np.ndarray,
+    reference: np.ndarray,
+    samples: int = MC_SAMPLES,
+    seed: int = 42,
+) -> float:
+    # Dokładnie dla 1-3 kryteriów, estymacja Monte Carlo dla większej liczby
+    points = np.asarray(points, dtype=float)
+    reference = np.asarray(reference, dtype=float)
+
+    points = points[(points < reference).all(axis=1)]
+    if len(points) == 0:
+        return 0.0
+    points = points[non_dominated(points)]
+
+    criterions = len(reference)
+    if criterions == 1:
+        return float(reference[0] - points[:, 0].min())
+    if criterions == 2:
+        return _hypervolume_2d(points, reference)
+    if criterions == 3:
+        return _hypervolume_3d(points, reference)
+    return _hypervolume_mc(points, reference, samples, seed)
@@ -0,0 +1,114 @@
+import numpy as np
+
+# Wszystkie funkcje operują na macierzy (n, k) wartości kryteriów (minimalizacja)
+
+KUNG_BASE_SIZE = 32
+
+
+def _dominated_by(points: np.ndarray, others: np.ndarray) -> np.ndarray:
+    # Czy punkty są zdominowane przez którykolwiek z pozostałych punktów
+    not_worse = (others[np.newaxis] <= points[:, np.newaxis]).all(axis=-1)
+    better = (others[np.newaxis] < points[:, np.newaxis]).any(axis=-1)
+
+    return (not_worse & better).any(axis=1)
+
+
+def _non_dominated_1d(points: np.ndarray) -> np.ndarray:
+    return points[:, 0] == points[:, 0].min()
+
+
+def _non_dominated_2d(points: np.ndarray) -> np.ndarray:
+    # Sortowanie i przeszukanie - O(n log n)
+    order = np.lexsort((points[:, 1], points[:, 0]))
+    f1, f2 = points[order, 0], points[order, 1]
+
+    # Grupy równych wartości pierwszego kryterium, w grupie rosnąco po drugim
+    group_start = np.r_[True, f1[1:] != f1[:-1]]
+    group_id = group_start.cumsum() - 1
+    group_min = f2[group_start]
+    prev_min = np.r_[np.inf, np.minimum.accumulate(group_min)[:-1]]
+
+    keep = (f2 == group_min[group_id]) & (f2 < prev_min[group_id])
+
+    mask = np.zeros(len(points), dtype=bool)
+    mask[order] = keep
+    return mask
+
+
+def _kung(points: np.ndarray, idx: np.ndarray) -> np.ndarray:
+    # Punkty posortowane leksykograficznie - punkt z dolnej połowy nie może
+    # zdominować punktu z górnej
+    if len(idx) <= KUNG_BASE_SIZE:
+        return idx[~_dominated_by(points[idx], points[idx])]
+
+    half = len(idx) // 2
+    top = _kung(points, idx[:half])
+    bottom = _kung(points, idx[half:])
+
+    dominated = _dominated_by(points[bottom], points[top])
+
+    return np.concatenate([top, bottom[~dominated]])
+
+
+def _non_dominated_kd(points: np.ndarray) -> np.ndarray:
+    # Algorytm Kunga (dziel i zwyciężaj)
+    order = np.lexsort(points.T[::-1])
+    front = _kung(points, order)
+
+    mask = np.zeros(len(points), dtype=bool)
+    mask[front] = True
+    return mask
+
+
+def non_dominated(points: np.ndarray) -> np.ndarray:
+    # Maska punktów pierwszego frontu Pareto
+    points = np.asarray(points, dtype=float)
+    if len(points) == 0:
+        return np.zeros(0, dtype=bool)
+
+    criterions = points.shape[1]
+    if criterions == 1:
+        return _non_dominated_1d(points)
+    if criterions == 2:
+        return _non_dominated_2d(points)
+    return _non_dominated_kd(points)
+
+
+def front_ranks(points: np.ndarray) -> np.ndarray:
+    # Numer frontu każdego punktu (0 - front Pareto), kolejne fronty
+    # wyznaczane po usunięciu poprzednich
+    points = np.asarray(points, dtype=float)
+    ranks = np.full(len(points), -1)
+
+    remaining = np.arange(len(points))
+    rank = 0
+    while len(remaining):
+        front = non_dominated(points[remaining])
+        ranks[remaining[front]] = rank
+        remaining = remaining[~front]
+        rank += 1
+
+    return ranks
+
+
+def crowding_distance(points: np.ndarray) -> np.ndarray:
+    # Odległość zatłoczenia (NSGA-II), punkty brzegowe mają odległość
+    # nieskończoną
+    points = np.asarray(points, dtype=float)
+    n = len(points)
+    distance = np.zeros(n)
+    if n <= 2:
+        distance[:] = np.inf
+        return distance
+
+    for values in points.T:
+        order = values.argsort()
+        sorted_values = values[order]
+        value_range = sorted_values[-1] - sorted_values[0]
+
+        distance[order[0]] = distance[order[-1]] = np.inf
+        if value_range > 0:
+            gaps = sorted_values[2:] - sorted_values[:-2]
+            distance[order[1:-1]] += gaps / value_range
+
+    return distance
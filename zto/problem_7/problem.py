@@ -3,6 +3,7 @@ from functools import total_ordering
 from typing import Optional
 
 import numpy as np
+from zto.lab.cache import get_instance
 from zto.RNG.RandomNumberGenerator import RandomNumberGenerator as RNG
 
 TOTAL_FLOW = 'total_flow'
@@ -12,6 +13,23 @@ TOTAL_LATE = 'total_late'
 MIX = 'mix'
 
 
+# Do tylu zadań sąsiedzi są przeliczani od pierwszej zmienionej pozycji w czystym
+# Pythonie, przy większych instancjach pełna ocena w NumPy jest szybsza
+INCREMENTAL_TASKS = 64
+
+
+def completion_times(p: np.ndarray, orders: np.ndarray) -> np.ndarray:
+    # Czasy zakończenia zadań na ostatniej maszynie dla (k, tasks) kolejności
+    # C[m, t] = S[t] + max_{s <= t}(C[m - 1, s] - S[s - 1]), S - suma prefiksowa
+    times = np.zeros(orders.shape, dtype=p.dtype)
+    for machine_p in p:
+        task_p = machine_p[orders]
+        cum_p = task_p.cumsum(axis=1)
+        times = cum_p + np.maximum.accumulate(times - cum_p + task_p, axis=1)
+
+    return times
+
+
 class FlowProblem:
     def __init__(
         self,
@@ -25,19 +43,31 @@ class FlowProblem:
         self.criterions = criterions
         self.mixing_coef = self._calculate_mixing_coefs()
 
-        rng = RNG(rnd_seed)
-        self.p = np.array(
-            [
-                [rng.nextInt(1, 99) for _ in range(self.tasks)]
-                for _ in range(self.machines)
-            ]
+        instance = get_instance(
+            type(self),
+            (task_num, self.machines, rnd_seed),
+            lambda: self._generate(task_num, self.machines, rnd_seed),
         )
-        tmp_a = self.p.sum()
+        self.p = instance['p']
+        self.d = instance['d']
+
+        self.incremental = task_num <= INCREMENTAL_TASKS
+        # Wiersze czasów zadań i terminy jako listy dla oceny w Pythonie
+        self._p_rows = self.p.T.tolist()
+        self._d_list = self.d.tolist()
+
+    @staticmethod
+    def _generate(tasks: int, machines: int, rnd_seed: int) -> dict:
+        rng = RNG(rnd_seed)
+        p = rng.nextInts(1, 99, machines * tasks).reshape(machines, tasks)
+        tmp_a = p.sum()
 
         a = tmp_a / 6
         b = tmp_a / 2
 
-        self.d = np.array([rng.nextInt(a, b) for _ in range(self.tasks)])
+        d = rng.nextInts(a, b, tasks)
+
+        return {'p': p, 'd': d}
 
     def initialize(self) -> 'FlowSolution':
         order = list(range(self.tasks))
@@ -45,6 +75,71 @@ class FlowProblem:
 
         return FlowSolution(order, self.criterions)
 
+    def evaluate_orders(self, orders: np.ndarray) -> dict[str, np.ndarray]:
+        # Wartości wszystkich kryteriów dla (k, tasks) kolejności
+        finish_time = completion_times(self.p, orders)
+        lateness = finish_time - self.d
+        tardiness = np.clip(lateness, 0, None)
+
+        return self._to_state(
+            finish_time.sum(axis=1),
+            tardiness.max(axis=1),
+            tardiness.sum(axis=1),
+            lateness.sum(axis=1),
+        )
+
+    def evaluate_tail(
+        self, order: list[int], prefix: list[tuple], start: int
+    ) -> list[tuple]:
+        # Stan po każdej pozycji: czasy zakończenia na maszynach oraz skumulowane
+        # przepływ, spóźnienie, opóźnienie i maksymalne spóźnienie.
+        # Pozycje przed start są przepisywane z prefix.
+        p, d = self._p_rows, self._d_list
+        if start > 0:
+            last = prefix[start - 1]
+            times = list(last[: self.machines])
+            flow, tard, late, max_tard = last[self.machines :]
+        else:
+            times = [0] * self.machines
+            flow = tard = late = max_tard = 0
+
+        rows = prefix[:start]
+        for pos in range(start, len(order)):
+            c = 0
+            for m, machine_p in enumerate(p[order[pos]]):
+                t = times[m]
+                c = (t if t > c else c) + machine_p
+                times[m] = c
+
+            lateness = c - d[pos]
+            flow += c
+            late += lateness
+            if lateness > 0:
+                tard += lateness
+                if lateness > max_tard:
+                    max_tard = lateness
+
+            rows.append((*times, flow, tard, late, max_tard))
+
+        return rows
+
+    def row_to_state(self, row: tuple) -> dict:
+        total_flow, total_tard, total_late, max_tard = row[self.machines :]
+
+        return self._to_state(total_flow, max_tard, total_tard, total_late)
+
+    def _to_state(
+        self, total_flow: float, max_tard: float, total_tard: float, total_late: float
+    ) -> dict:
+        c1, c2, c3 = self.mixing_coef
+        return {
+            TOTAL_FLOW: total_flow,
+            MAX_TARD: max_tard,
+            TOTAL_TARD: total_tard,
+            TOTAL_LATE: total_late,
+            MIX: c1 * total_flow + c2 * max_tard + c3 * total_tard,
+        }
+
     def _calculate_mixing_coefs(self) -> tuple[float, float, float]:
         mean_p = (99 - 1 + 1) / 2
         tmp_mean_A = self.machines * self.tasks * mean_p
@@ -72,10 +167,17 @@ class FlowSolution:
         self,
         order: list[int],
         criterions: list[str],
+        parent: Optional['FlowSolution'] = None,
+        changed_from: int = 0,
     ) -> None:
         self.order = order
         self.criterions = criterions
 
+        # Rozwiązanie, z którego powstało - pozycje przed changed_from
+        # są takie same i nie wymagają ponownego przeliczenia
+        self.parent = parent
+        self.changed_from = changed_from
+
         self.state = {
             TOTAL_FLOW: 0.0,
             MAX_TARD: 0.0,
@@ -94,37 +196,23 @@ class FlowSolution:
             new_order[swap_idx1],
         )
 
-        return FlowSolution(new_order, self.criterions)
+        return FlowSolution(new_order, self.criterions, self, min(swap_idx1, swap_idx2))
 
     def evalueate(self, problem: FlowProblem) -> None:
         if not self.evalueated:
-            last_machine_time = [0 for _ in range(problem.tasks)]
-            curr_machine_time = [0 for _ in range(problem.tasks)]
-            for m in range(problem.machines):
-                for t in range(problem.tasks):
-                    task_idx = self.order[t]
-                    if t == 0:
-                        wait_time = last_machine_time[t]
-                    else:
-                        wait_time = max(last_machine_time[t], curr_machine_time[t - 1])
-
-                    curr_machine_time[t] = wait_time + problem.p[m, task_idx]
-
-                last_machine_time = curr_machine_time
-
-            finish_time = np.array(last_machine_time)
-            self.state[TOTAL_FLOW] = finish_time.sum()
-            self.state[MAX_TARD] = np.clip((finish_time - problem.d), 0, None).max()
-            self.state[TOTAL_TARD] = np.clip((finish_time - problem.d), 0, None).sum()
-            self.state[TOTAL_LATE] = (finish_time - problem.d).sum()
-
-            if problem.mixing_coef is not None:
-                c1, c2, c3 = problem.mixing_coef
-                self.state[MIX] = (
-                    c1 * self.state[TOTAL_FLOW]
-                    + c2 * self.state[MAX_TARD]
-                    + c3 * self.state[TOTAL_TARD]
-                )
+            if problem.incremental:
+                if self.parent is not None and self.parent.evalueated:
+                    prefix, start = self.parent.prefix, self.changed_from
+                else:
+                    prefix, start = [], 0
+
+                self.prefix = problem.evaluate_tail(self.order, prefix, start)
+                self.state.update(problem.row_to_state(self.prefix[-1]))
+            else:
+                state = problem.evaluate_orders(np.array([self.order]))
+                for c, values in state.items():
+                    self.state[c] = values[0]
+            self.parent = None
 
         self.evalueated = True
 
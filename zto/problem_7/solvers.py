@@ -1,17 +1,25 @@
 from random import random
 
+from .archive import ParetoArchive
 from .problem import FlowProblem, FlowSolution
 
 
 class Solver:
-    def __init__(self, max_iters: int) -> None:
+    def __init__(
+        self, max_iters: int, archive_capacity: int = -1, keep_history: bool = True
+    ) -> None:
         self.max_iters = max_iters
+        self.archive_capacity = archive_capacity
+        # Bez historii zwracane jest tylko archiwum Pareto (stała pamięć)
+        self.keep_history = keep_history
 
     def solve(self, problem: FlowProblem) -> list[FlowSolution]:
         self.problem = problem
+        self.archive = ParetoArchive(problem.criterions, self.archive_capacity)
 
         solution = problem.initialize()
         solution.evalueate(problem)
+        self.archive.add(solution)
         selected_solutions = [solution]
 
         add_prob_base = 0.995
@@ -23,6 +31,10 @@ class Solver:
             new_solution.evalueate(problem)
             if new_solution.dominates(solution) or random() < add_prob:
                 solution = new_solution
-                selected_solutions.append(solution)
+                self.archive.add(solution)
+                if self.keep_history:
+                    selected_solutions.append(solution)
 
+        if not self.keep_history:
+            return self.archive.solutions
         return selected_solutions
@@ -4,6 +4,8 @@ import matplotlib.pyplot as plt
 import numpy as np
 from tabulate import tabulate
 
+from .hypervolume import hypervolume
+from .pareto import non_dominated
 from .problem import (
     MAX_TARD,
     MIX,
@@ -21,16 +23,13 @@ TASKS = 15
 
 
 def get_pareto(solutions: list[FlowSolution]) -> list[FlowSolution]:
-    s_num = len(solutions)
+    if not solutions:
+        return []
 
-    drop_idx = []
-    for i in range(s_num):
-        for j in range(s_num):
-            if i != j and solutions[j].dominates(solutions[i]):
-                drop_idx.append(i)
-                break
+    points = np.array([[s.state[c] for c in s.criterions] for s in solutions])
+    pareto_mask = non_dominated(points)
 
-    return [solutions[i] for i in range(s_num) if i not in drop_idx]
+    return [s for s, is_pareto in zip(solutions, pareto_mask) if is_pareto]
 
 
 def solutions_to_points(
@@ -58,43 +57,20 @@ def visualize_pareto(
     plt.show()
 
 
-def get_area(x1: tuple[float, float], x2: tuple[float, float]) -> float:
-    return (x2[0] - x1[0]) * (x2[1] - x1[1])
-
-
 def get_hvi(
     paretos: list[list[FlowSolution]],
     criterions: list[str],
     scale: float = 1.0,
 ) -> list[float]:
-    pareto_ps = []
-    xs, ys = [], []
-    for pareto in paretos:
-        p = solutions_to_points(pareto, criterions)
-        pareto_ps.append(p)
-
-        xs.append(p[0])
-        ys.append(p[1])
-    z = [
-        scale * np.concatenate(xs).max(),
-        scale * np.concatenate(ys).max(),
+    pareto_ps = [
+        np.array([[s.state[c] for c in criterions] for s in pareto])
+        for pareto in paretos
     ]
 
-    areas = []
-    for pareto_p in pareto_ps:
-        curr_z = z.copy()
-        pareto_x, pareto_y = pareto_p
-        sort_idx = pareto_x.argsort()
-        pareto_x, pareto_y = pareto_x[sort_idx], pareto_y[sort_idx]
-
-        total_area = 0
-        for ps in zip(pareto_x, pareto_y):
-            total_area += get_area(ps, curr_z)
-            curr_z[1] = ps[1]
+    max_p = np.concatenate(pareto_ps).max(axis=0)
+    z = max_p + (scale - 1) * np.abs(max_p)
 
-        areas.append(total_area)
-
-    return areas
+    return [hypervolume(pareto_p, z) for pareto_p in pareto_ps]
 
 
 def bar_plot(solutions: list[FlowSolution], criterions: list[str]) -> None:
@@ -193,7 +169,7 @@ def zad1(seeds: list[int]) -> None:
             solver = Solver(il)
             solutions = solver.solve(problem)
 
-            pareto = get_pareto(solutions)
+            pareto = solver.archive.solutions
 
             all_paretos.append(pareto)
         visualize_pareto(solutions, pareto, criterions)
@@ -246,3 +222,6 @@ def zad3(seed: int) -> None:
     scatter_plot(combined_solutions, criterions)
 
     get_latex_star(combined_solutions, solutions, criterions)
+
+    hvi = get_hvi([pareto], criterions, 1.2)[0]
+    print(f'HVI: {hvi:.1f}')